@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+set -eo pipefail
+
+# 사용 예: ./benchmark.sh --scale 1k 100k
+#         ./benchmark.sh --scale 1k --update-baseline
+#         ./benchmark.sh --ci  (기준값이 없거나 비교할 수 없으면 실패)
+cd ../src
+
+echo "Starting endpoint benchmark"
+poetry run python manage.py benchmark_endpoints "$@"
+echo "OK"
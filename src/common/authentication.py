@@ -0,0 +1,87 @@
+from django.utils.functional import cached_property
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from users.models import User
+
+
+class LazyTokenUser(TokenUser):
+    """
+    토큰 클레임만으로 구성되는 사용자 객체
+
+    id 등 토큰에 담긴 값은 DB 조회 없이 사용하고,
+    users.User 의 다른 필드가 필요할 때만 한 번 조회하여 캐시한다.
+    """
+
+    @cached_property
+    def id(self):
+        # simplejwt 버전에 따라 문자열로 저장되는 user_id 를 pk 타입으로 맞춘다
+        return User._meta.pk.to_python(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def instance(self):
+        # 조회하는 시점에는 simplejwt 기본 get_user 처럼 없거나 비활성화된 사용자를 거부
+        try:
+            user = User.objects.get(pk=self.id)
+        except User.DoesNotExist:
+            raise AuthenticationFailed(
+                "사용자를 찾을 수 없습니다.", code="user_not_found"
+            )
+        if not user.is_active:
+            raise AuthenticationFailed("비활성화된 사용자입니다.", code="user_inactive")
+        return user
+
+    @cached_property
+    def is_staff(self):
+        return self.instance.is_staff
+
+    @cached_property
+    def is_superuser(self):
+        return self.instance.is_superuser
+
+    def __eq__(self, other):
+        if isinstance(other, User):
+            return self.id == other.pk
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __getattr__(self, attr):
+        # 토큰에 없는 속성은 실제 User 인스턴스에서 가져온다
+        if attr.startswith("_") or attr in ("token", "instance"):
+            raise AttributeError(attr)
+        return getattr(self.instance, attr)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    요청마다 users_user 를 조회하지 않는 JWT 인증
+
+    검증된 토큰으로 LazyTokenUser 를 만들어 request.user 로 사용한다.
+
+    사용자 존재, 활성 여부는 users.User 를 조회할 때만 확인하므로, 비활성화되거나
+    탈퇴한 사용자도 Access Token 이 만료될 때까지(ACCESS_TOKEN_LIFETIME)는 토큰의
+    id 만 쓰는 API 를 호출할 수 있다. 탈퇴 후 고객 생성은 CustomerListCreateView 에서
+    따로 막는다.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("토큰에 사용자 식별 정보가 없습니다.")
+
+        return LazyTokenUser(validated_token)
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    """
+    스웨거 문서용 StatelessJWTAuthentication 인증 스키마
+    """
+
+    target_class = "common.authentication.StatelessJWTAuthentication"
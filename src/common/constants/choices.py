@@ -7,3 +7,10 @@ STATUS_CHOICES = [
 ]
 
 GENDER_CHOICES = [("Male", "남성"), ("Female", "여성")]
+
+JOB_STATUS_CHOICES = [
+    ("pending", "대기"),
+    ("running", "실행중"),
+    ("done", "완료"),
+    ("failed", "실패"),
+]
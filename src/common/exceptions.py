@@ -1,5 +1,13 @@
-from common.logging_config import logger
+import atexit
+import threading
+import time
+
+from common.logging_config import get_logger
+from django.conf import settings
 from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler
+
+logger = get_logger()
 
 
 class CustomAPIException(APIException):
@@ -15,46 +23,20 @@ class CustomAPIException(APIException):
             self.status_code = status_code
 
         # 부모 생성자 호출로 detail과 code 설정
+        # (로깅은 custom_exception_handler 에서 처리하므로 request 는 사용하지 않음)
         super().__init__(
             detail=detail or self.default_detail, code=code or self.default_code
         )
-
-        # 로깅 추가
-        if request:
-            logger.error(
-                f"Error occurred - Path: {request.path}, Method: {request.method}, "
-                f"User: {getattr(request, 'user', 'Anonymous')}, Code: {self.code}, Detail: {self.detail}"
-            )
-        else:
-            logger.error(f"Error occurred - Code: {self.code}, Detail: {self.detail}")
+        self.code = code or self.default_code
 
 
-class BadRequestException(APIException):
+class BadRequestException(CustomAPIException):
     """400 Bad Request"""
 
     status_code = 400
     default_detail = "잘못된 요청입니다."
     default_code = "bad_request"
 
-    def __init__(self, detail=None, code=None, status_code=None, request=None):
-        # 상태 코드가 제공되면 재설정
-        if status_code:
-            self.status_code = status_code
-
-        # 부모 생성자 호출로 detail과 code 설정
-        super().__init__(
-            detail=detail or self.default_detail, code=code or self.default_code
-        )
-
-        # 로깅 추가
-        if request:
-            logger.error(
-                f"Error occurred - Path: {request.path}, Method: {request.method}, "
-                f"User: {getattr(request, 'user', 'Anonymous')}, Code: {self.code}, Detail: {self.detail}"
-            )
-        else:
-            logger.error(f"Error occurred - Code: {self.code}, Detail: {self.detail}")
-
 
 class NotFoundException(CustomAPIException):
     """404 Not Found"""
@@ -78,3 +60,147 @@ class UnauthorizedException(CustomAPIException):
     status_code = 401
     default_detail = "인증이 필요합니다."
     default_code = "unauthorized"
+
+
+class ConflictException(CustomAPIException):
+    """409 Conflict"""
+
+    status_code = 409
+    default_detail = "요청이 현재 리소스 상태와 충돌합니다."
+    default_code = "conflict"
+
+
+class PayloadTooLargeException(CustomAPIException):
+    """413 Payload Too Large"""
+
+    status_code = 413
+    default_detail = "업로드 가능한 용량을 초과했습니다."
+    default_code = "payload_too_large"
+
+
+class ErrorLogThrottle:
+    """
+    (경로, 오류 코드) 별로 오류 로그를 묶어서 남기는 스로틀
+
+    같은 키의 오류는 window 초 동안 처음 한 번만 기록하고 나머지는 개수만 센다.
+    window 가 지나면 생략된 개수를 한 줄로 요약하여 기록한다. 오류가 더 들어오지 않아도
+    요약이 남도록 타이머로 기록하고, 프로세스가 종료될 때 남은 요약도 모두 기록한다.
+    """
+
+    # 키가 너무 많아지면 요약을 모두 기록하고 비운다
+    max_keys = 1000
+
+    def __init__(self, window):
+        self.window = window
+        self.lock = threading.Lock()
+        # key -> [window 시작 시각, 생략된 개수]
+        self.entries = {}
+        # 생략된 오류 요약을 기록할 타이머와 그 실행 시각
+        self.timer = None
+        self.timer_at = None
+        atexit.register(self.flush)
+
+    def should_log(self, key):
+        """
+        지금 기록해야 하면 True, 생략하면 False
+        """
+        now = time.monotonic()
+        with self.lock:
+            self.flush_expired(now)
+            entry = self.entries.get(key)
+            if entry is None:
+                if len(self.entries) >= self.max_keys:
+                    self.flush_expired(now, force=True)
+                self.entries[key] = [now, 0]
+                return True
+            entry[1] += 1
+            self.schedule_flush(entry[0] + self.window)
+            return False
+
+    def schedule_flush(self, at):
+        """
+        at 시각(monotonic)에 만료된 요약을 기록하도록 타이머 예약 (lock 안에서 호출)
+        """
+        if self.timer is not None:
+            if self.timer_at <= at:
+                return
+            self.timer.cancel()
+        self.timer = threading.Timer(max(at - time.monotonic(), 0), self.flush_pending)
+        self.timer.daemon = True
+        self.timer_at = at
+        self.timer.start()
+
+    def flush_pending(self):
+        now = time.monotonic()
+        with self.lock:
+            self.timer = self.timer_at = None
+            self.flush_expired(now)
+            pending = [
+                started for started, suppressed in self.entries.values() if suppressed
+            ]
+            if pending:
+                self.schedule_flush(min(pending) + self.window)
+
+    def flush(self):
+        """
+        남은 요약을 window 와 상관없이 모두 기록 (프로세스 종료 시 호출)
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = self.timer_at = None
+            self.flush_expired(time.monotonic(), force=True)
+
+    def flush_expired(self, now, force=False):
+        for key, (started, suppressed) in list(self.entries.items()):
+            if not force and now - started < self.window:
+                continue
+            del self.entries[key]
+            if suppressed:
+                route, code = key
+                logger.error(
+                    "반복 오류 요약",
+                    route=route,
+                    code=code,
+                    suppressed=suppressed,
+                    window_s=self.window,
+                )
+
+
+error_log_throttle = ErrorLogThrottle(
+    getattr(settings, "ERROR_LOG_THROTTLE_SECONDS", 60)
+)
+
+
+def custom_exception_handler(exc, context):
+    """
+    DRF 기본 예외 처리 후 CustomAPIException 을 스로틀링하여 로그로 남긴다
+    """
+    response = exception_handler(exc, context)
+    if not isinstance(exc, CustomAPIException):
+        return response
+
+    request = context.get("request")
+    route = path = method = user_id = None
+    if request is not None:
+        path, method = request.path, request.method
+        # /counsels/1/, /counsels/2/ 처럼 id 만 다른 요청을 같은 키로 묶는다
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match else path
+        try:
+            user_id = getattr(request.user, "id", None)
+        except APIException:
+            # 인증 단계에서 발생한 예외면 사용자를 알 수 없다
+            user_id = None
+
+    if error_log_throttle.should_log((route, exc.code)):
+        logger.error(
+            "Error occurred",
+            path=path,
+            method=method,
+            user_id=user_id,
+            status=exc.status_code,
+            code=exc.code,
+            detail=exc.detail,
+        )
+    return response
@@ -0,0 +1,59 @@
+import re
+
+# 한글 음절 초성 (유니코드 순서)
+CHOSEONG = list("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+CHOSEONG_SET = set(CHOSEONG)
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+# 초성 하나당 중성(21) x 종성(28) 개의 음절
+SYLLABLES_PER_CHOSEONG = 21 * 28
+
+NON_DIGIT_PATTERN = re.compile(r"\D")
+PHONE_SUFFIX_LENGTH = 4
+
+
+def to_choseong(text):
+    """
+    문자열을 초성 문자열로 변환 (예: "김민수" -> "ㄱㅁㅅ")
+    한글 음절이 아닌 문자는 공백을 제외하고 소문자로 그대로 둔다.
+    """
+    result = []
+    for char in text or "":
+        code = ord(char)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            index = (code - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSEONG
+            result.append(CHOSEONG[index])
+        elif not char.isspace():
+            result.append(char.lower())
+    return "".join(result)
+
+
+def has_choseong(text):
+    """
+    문자열에 초성(자음) 글자가 포함되어 있는지 여부
+    """
+    return any(char in CHOSEONG_SET for char in text)
+
+
+def has_hangul_syllable(text):
+    """
+    문자열에 완성된 한글 음절이 포함되어 있는지 여부
+    """
+    return any(
+        HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END for char in text
+    )
+
+
+def normalize_phone_number(phone_number):
+    """
+    전화번호에서 숫자만 남긴다 (예: "010-1234-5678" -> "01012345678")
+    """
+    return NON_DIGIT_PATTERN.sub("", phone_number or "")
+
+
+def phone_suffix(phone_number):
+    """
+    전화번호 뒤 4자리
+    """
+    return normalize_phone_number(phone_number)[-PHONE_SUFFIX_LENGTH:]
@@ -0,0 +1,226 @@
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from common.logging_config import get_logger
+from common.models import Job
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+# 공통 로거 가져오기
+logger = get_logger()
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    func: Callable
+    max_attempts: int
+    retry_delay: int
+
+
+# 작업 이름 -> JobSpec
+registry = {}
+
+
+def job(name=None, max_attempts=3, retry_delay=30):
+    """
+    함수를 백그라운드 작업으로 등록하는 데코레이터
+
+        @job()
+        def extract_text(document_id): ...
+
+        enqueue(extract_text, document_id=1)
+
+    실패하면 retry_delay 초부터 두 배씩 늘려가며 max_attempts 번까지 실행한다.
+    작업 인자는 JSON 으로 저장되므로 id 같은 단순한 값만 넘긴다.
+    """
+
+    def decorator(func):
+        func.job_name = name or f"{func.__module__}.{func.__name__}"
+        registry[func.job_name] = JobSpec(func, max_attempts, retry_delay)
+        return func
+
+    return decorator
+
+
+def autodiscover():
+    """
+    설치된 앱의 jobs 모듈을 불러와 작업을 등록
+    """
+    autodiscover_modules("jobs")
+
+
+def enqueue(func, run_at=None, **payload):
+    """
+    작업을 큐에 넣는다 (func 는 등록된 함수 또는 작업 이름)
+
+    현재 트랜잭션과 함께 커밋되므로 롤백되면 작업도 실행되지 않고,
+    커밋되면 요청 처리가 끝난 뒤 워커(run_jobs)가 실행한다.
+    """
+    return Job.objects.create(
+        name=getattr(func, "job_name", func),
+        payload=payload,
+        run_at=run_at or timezone.now(),
+    )
+
+
+def claim_job(worker_id):
+    """
+    실행할 작업 하나를 가져와 running 으로 표시 (없으면 None)
+
+    SKIP LOCKED 로 다른 워커가 가져가는 중인 작업은 건너뛴다.
+    """
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", run_at__lte=timezone.now())
+            .order_by("run_at", "id")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = "running"
+        job.attempts += 1
+        job.locked_at = timezone.now()
+        job.locked_by = worker_id
+        job.save(
+            update_fields=["status", "attempts", "locked_at", "locked_by", "updated_at"]
+        )
+        return job
+
+
+def run_job(job):
+    """
+    작업을 실행하고 결과에 따라 완료, 재시도, 실패로 표시
+    """
+    spec = registry.get(job.name)
+    started = time.perf_counter()
+    try:
+        if spec is None:
+            raise LookupError(f"등록되지 않은 작업입니다: {job.name}")
+        spec.func(**job.payload)
+    except Exception:
+        fail_job(job, spec, traceback.format_exc())
+        return False
+
+    if not update_claimed_job(
+        job, status="done", locked_at=None, last_error="", updated_at=timezone.now()
+    ):
+        return False
+    logger.info(
+        "작업 완료",
+        job_id=job.id,
+        job=job.name,
+        attempts=job.attempts,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
+    return True
+
+
+def update_claimed_job(job, **fields):
+    """
+    이 워커가 가져간 running 상태일 때만 작업 상태를 바꾼다
+
+    실행이 오래 걸려 requeue_stale_jobs 가 작업을 되돌렸고 다른 워커가 다시 가져갔다면
+    그 워커의 결과를 덮어쓰지 않도록 아무것도 바꾸지 않고 False 를 돌려준다.
+    같은 워커가 다시 가져간 경우도 구분할 수 있도록 실행 횟수(attempts)까지 비교한다.
+    """
+    updated = Job.objects.filter(
+        pk=job.pk, status="running", locked_by=job.locked_by, attempts=job.attempts
+    ).update(**fields)
+    if not updated:
+        logger.warning(
+            "작업 상태 변경 건너뜀, 다른 워커가 가져갔거나 복구된 작업",
+            job_id=job.id,
+            job=job.name,
+            worker=job.locked_by,
+            status=fields["status"],
+        )
+    return bool(updated)
+
+
+def fail_job(job, spec, error):
+    now = timezone.now()
+    if spec is not None and job.attempts < spec.max_attempts:
+        delay = spec.retry_delay * 2 ** (job.attempts - 1)
+        if not update_claimed_job(
+            job,
+            status="pending",
+            run_at=now + timedelta(seconds=delay),
+            locked_at=None,
+            last_error=error,
+            updated_at=now,
+        ):
+            return
+        logger.warning(
+            "작업 실패, 재시도 예정",
+            job_id=job.id,
+            job=job.name,
+            attempts=job.attempts,
+            retry_in_s=delay,
+            error=error.strip().splitlines()[-1],
+        )
+        return
+
+    if not update_claimed_job(
+        job, status="failed", locked_at=None, last_error=error, updated_at=now
+    ):
+        return
+    logger.error(
+        "작업 실패", job_id=job.id, job=job.name, attempts=job.attempts, error=error
+    )
+
+
+def requeue_stale_jobs(timeout):
+    """
+    워커가 죽어 timeout 초 넘게 running 으로 남은 작업을 다시 실행하도록 되돌린다
+    (재시도 횟수를 다 쓴 작업은 실패로 표시)
+    """
+    stale = Job.objects.filter(
+        status="running",
+        locked_at__lt=timezone.now() - timedelta(seconds=timeout),
+    ).only("id", "name", "attempts", "locked_by")
+    for job in stale:
+        spec = registry.get(job.name)
+        if spec is not None and job.attempts < spec.max_attempts:
+            if not update_claimed_job(
+                job, status="pending", locked_at=None, updated_at=timezone.now()
+            ):
+                continue
+        else:
+            fail_job(job, None, "작업 시간이 초과되었거나 워커가 종료되었습니다.")
+        logger.warning("중단된 작업 복구", job_id=job.id, job=job.name)
+
+
+def delete_finished_jobs(retention):
+    """
+    완료된 지 retention 초가 지난 작업 삭제 (실패한 작업은 확인할 수 있도록 남김)
+    """
+    deleted, _ = Job.objects.filter(
+        status="done",
+        updated_at__lt=timezone.now() - timedelta(seconds=retention),
+    ).delete()
+    return deleted
+
+
+def work_loop(worker_id, stop, poll_interval, once=False):
+    """
+    stop 이 설정될 때까지 작업을 하나씩 가져와 실행 (스레드, 프로세스 워커 공용)
+
+    once 면 실행할 작업이 없을 때 종료한다.
+    """
+    try:
+        while not stop.is_set():
+            close_old_connections()
+            job = claim_job(worker_id)
+            if job is None:
+                if once:
+                    break
+                stop.wait(poll_interval)
+                continue
+            run_job(job)
+    finally:
+        connections.close_all()
@@ -1,4 +1,12 @@
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+from collections.abc import Mapping
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
 from pathlib import Path
 
 # 로그 디렉토리 설정
@@ -6,6 +14,130 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)  # logs 디렉토리 생성
 
+# 로그에 남기지 않을 필드 이름 (소문자, 부분 일치)
+SENSITIVE_FIELDS = ("password", "token", "secret", "authorization", "cookie", "key")
+REDACTED = "[REDACTED]"
+
+
+def watched_file_handler(filename, level):
+    """
+    외부 logrotate 가 파일을 옮기면 다시 여는 FileHandler
+
+    gunicorn 워커, run_jobs 프로세스 워커가 같은 파일에 쓰므로 프로세스 안에서
+    회전하지 않는다 (RotatingFileHandler 는 여러 프로세스의 회전을 지원하지 않아
+    먼저 회전한 프로세스가 파일을 지우면 나머지 프로세스의 로그가 사라진다).
+    회전과 압축은 scripts/logrotate.conf 로 처리한다.
+    """
+    handler = WatchedFileHandler(LOG_DIR / filename, encoding="utf-8", delay=True)
+    handler.setLevel(level)
+    return handler
+
+
+def is_sensitive(name):
+    name = str(name).lower()
+    return any(field in name for field in SENSITIVE_FIELDS)
+
+
+def redact(value):
+    """
+    민감한 필드의 값을 가린 사본을 반환 (중첩된 dict / list 포함)
+    """
+    if isinstance(value, Mapping):
+        return {
+            key: REDACTED if is_sensitive(key) else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return value
+
+
+class RedactingFilter(logging.Filter):
+    """
+    모든 로그 레코드의 구조화 필드와 인자에서 민감한 값을 가리는 필터
+    """
+
+    def filter(self, record):
+        fields = getattr(record, "fields", None)
+        if fields:
+            record.fields = redact(fields)
+        if isinstance(record.args, Mapping):
+            record.args = redact(record.args)
+        return True
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """
+    키워드 인자를 구조화 필드로 남기는 로거
+
+    logger.info("고객 생성 성공", user_id=1, customer_id=2)
+    메시지 포맷팅과 필드 처리는 해당 레벨이 활성화된 경우에만 이루어진다.
+    """
+
+    # logging.Logger._log 가 받는 키워드 인자
+    reserved = ("exc_info", "stack_info", "stacklevel", "extra")
+
+    def process(self, msg, kwargs):
+        fields = {
+            key: kwargs.pop(key) for key in list(kwargs) if key not in self.reserved
+        }
+        if fields:
+            kwargs["extra"] = {**kwargs.get("extra", {}), "fields": fields}
+        return msg, kwargs
+
+
+class KeyValueFormatter(logging.Formatter):
+    """
+    메시지 뒤에 구조화 필드를 key=value 형태로 덧붙이는 텍스트 포매터
+    """
+
+    def formatMessage(self, record):
+        message = super().formatMessage(record)
+        fields = getattr(record, "fields", None)
+        if not fields:
+            return message
+        pairs = " ".join(f"{key}={value}" for key, value in fields.items())
+        return f"{message} {pairs}"
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    한 줄에 하나의 JSON 객체로 출력하는 포매터
+    """
+
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created).astimezone().isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class StructuredQueueHandler(QueueHandler):
+    """
+    메시지와 예외만 미리 문자열로 만들어 큐에 넣는 QueueHandler
+
+    기본 QueueHandler 는 예외 내용을 메시지에 합쳐 버려서
+    JSON 포매터가 message 와 exception 을 구분할 수 없다.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
 # 공통 로거 설정
 logger = logging.getLogger("custom_api_logger")
 logger.setLevel(logging.DEBUG)
@@ -14,22 +146,64 @@ logger.setLevel(logging.DEBUG)
 stream_handler = logging.StreamHandler()
 stream_handler.setLevel(logging.DEBUG)
 
-# FileHandler 설정 (info.log)
-file_handler = logging.FileHandler(LOG_DIR / "info.log")
-file_handler.setLevel(logging.INFO)
+# FileHandler 설정 (info.log, error.log)
+file_handler = watched_file_handler("info.log", logging.INFO)
+error_file_handler = watched_file_handler("error.log", logging.ERROR)
 
-# FileHandler 설정 (error.log)
-error_file_handler = logging.FileHandler(LOG_DIR / "error.log")
-error_file_handler.setLevel(logging.ERROR)
-
-# 포매터 설정
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+# 포매터 설정 (콘솔은 사람이 읽기 쉬운 텍스트, 파일은 수집용 JSON)
+formatter = KeyValueFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+json_formatter = JsonFormatter()
 stream_handler.setFormatter(formatter)
-file_handler.setFormatter(formatter)
-error_file_handler.setFormatter(formatter)
+file_handler.setFormatter(json_formatter)
+error_file_handler.setFormatter(json_formatter)
+
+# 요청 스레드는 큐에 레코드를 넣기만 하고, 실제 출력은 리스너 스레드가 처리
+log_queue = queue.SimpleQueue()
+queue_handler = StructuredQueueHandler(log_queue)
+# 민감 정보 제거는 이 필터 한 곳에서만 처리
+queue_handler.addFilter(RedactingFilter())
+queue_listener = QueueListener(
+    log_queue,
+    stream_handler,
+    file_handler,
+    error_file_handler,
+    respect_handler_level=True,
+)
+
+
+def get_logger():
+    """
+    공통 로거를 구조화 로거로 반환
+    """
+    return StructuredLogger(logger)
+
+
+def start_queue_listener():
+    queue_listener.start()
+
+
+def stop_queue_listener():
+    """
+    종료 시 큐에 남은 로그를 모두 기록
+    """
+    queue_listener.stop()
+
+
+def restart_queue_listener():
+    """
+    fork 된 자식 프로세스에는 리스너 스레드가 없으므로 새 리스너를 시작
+    (gunicorn --preload, 더미 데이터 생성 워커 등)
+    """
+    global queue_listener
+    queue_listener = QueueListener(
+        log_queue, *queue_listener.handlers, respect_handler_level=True
+    )
+    queue_listener.start()
+
 
 # 핸들러를 로거에 추가
 if not logger.hasHandlers():
-    logger.addHandler(stream_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(error_file_handler)
+    logger.addHandler(queue_handler)
+    start_queue_listener()
+    atexit.register(stop_queue_listener)
+    os.register_at_fork(after_in_child=restart_queue_listener)
@@ -0,0 +1,661 @@
+import hashlib
+import json
+import logging
+import math
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from common.management.commands.create_dummy_data import DUMMY_PHONE_PREFIX
+from counsels.models import (Counsel, CounselDocument, DocumentBlob,
+                             DocumentText, DocumentUploadSession)
+from counsels.previews import preview_name
+from customers.models import Customer
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.runner import DiscoverRunner
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from oauth.token_store import save_refresh_token
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from users.models import User
+
+API_PREFIX = "/api/v1"
+BENCHMARK_PASSWORD = "password123"
+BENCHMARK_DOCUMENT = b"benchmark\n"
+DEFAULT_BASELINE = settings.BASE_DIR / "benchmarks" / "baseline.json"
+DEFAULT_REPORT = settings.BASE_DIR / "benchmarks" / "report.json"
+
+# 규모별 더미 데이터 (상담 기록 수 기준)
+SCALES = {
+    "1k": {"users": 10, "customers": 10, "counsels": 10, "documents": 1},
+    "100k": {"users": 100, "customers": 100, "counsels": 10, "documents": 1},
+    "1m": {"users": 1000, "customers": 100, "counsels": 10, "documents": 1},
+}
+
+
+def percentile(values, percent):
+    """
+    nearest-rank 방식 백분위수
+    """
+    ordered = sorted(values)
+    index = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+class EndpointBenchmark:
+    """
+    한 규모의 데이터에 대해 모든 엔드포인트를 반복 호출하여 지연 시간과 쿼리 수를 측정
+
+    각 시나리오 메서드는 측정하지 않는 준비 작업을 마친 뒤
+    (client, method, path, kwargs) 를 반환한다.
+    """
+
+    def __init__(self, iterations, warmup):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.sequence = 0
+
+        # 모든 더미 유저의 데이터 양이 같으므로 첫 번째 더미 유저로 측정
+        self.user = (
+            User.objects.filter(phone_number__startswith=f"{DUMMY_PHONE_PREFIX}-")
+            .order_by("id")
+            .first()
+        )
+        if self.user is None:
+            raise CommandError("벤치마크에 사용할 더미 유저가 없습니다.")
+
+        self.customer = Customer.objects.filter(user=self.user).order_by("id").first()
+        self.counsel = (
+            Counsel.objects.filter(customer=self.customer).order_by("id").first()
+        )
+        self.document = (
+            CounselDocument.objects.filter(counsel=self.counsel).order_by("id").first()
+        )
+
+        self.anonymous = APIClient(raise_request_exception=False)
+        self.client = APIClient(raise_request_exception=False)
+        self.access_token, self.refresh_token = self.issue_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        # 관리자 전용 API 측정용
+        self.staff_client = APIClient(raise_request_exception=False)
+        staff = User.objects.create_user(
+            "016-0000-0000",
+            "관리자",
+            "Male",
+            "1990-01-01",
+            "서울",
+            password=BENCHMARK_PASSWORD,
+            is_staff=True,
+        )
+        staff_token = RefreshToken.for_user(staff).access_token
+        self.staff_client.credentials(HTTP_AUTHORIZATION=f"Bearer {staff_token}")
+
+    def scenarios(self):
+        return [
+            ("oauth:login", self.oauth_login),
+            ("oauth:refresh", self.oauth_refresh),
+            ("oauth:logout", self.oauth_logout),
+            ("users:create", self.users_create),
+            ("users:info", self.users_info),
+            ("users:update", self.users_update),
+            ("users:delete", self.users_delete),
+            ("customers:list", self.customers_list),
+            ("customers:list-next", self.customers_list_next),
+            ("customers:search-choseong", self.customers_search_choseong),
+            ("customers:search-phone", self.customers_search_phone),
+            ("customers:create", self.customers_create),
+            ("customers:detail", self.customers_detail),
+            ("customers:update", self.customers_update),
+            ("customers:delete", self.customers_delete),
+            ("customers:security", self.customers_security),
+            ("customers:security-update", self.customers_security_update),
+            ("customers:timeline", self.customers_timeline),
+            ("counsels:list", self.counsels_list),
+            ("counsels:list-filtered", self.counsels_list_filtered),
+            ("counsels:search", self.counsels_search),
+            ("counsels:create", self.counsels_create),
+            ("counsels:detail", self.counsels_detail),
+            ("counsels:update", self.counsels_update),
+            ("counsels:delete", self.counsels_delete),
+            ("documents:list", self.documents_list),
+            ("documents:create", self.documents_create),
+            ("documents:detail", self.documents_detail),
+            ("documents:update", self.documents_update),
+            ("documents:delete", self.documents_delete),
+            ("documents:download", self.documents_download),
+            ("documents:search", self.documents_search),
+            ("documents:thumbnail", self.documents_thumbnail),
+            ("uploads:create", self.uploads_create),
+            ("uploads:detail", self.uploads_detail),
+            ("uploads:chunk", self.uploads_chunk),
+            ("uploads:delete", self.uploads_delete),
+            ("uploads:finalize", self.uploads_finalize),
+            ("health:db", self.health_db),
+        ]
+
+    def run(self):
+        results = {}
+        for name, scenario in self.scenarios():
+            results[name] = self.measure(scenario)
+        return results
+
+    def measure(self, scenario):
+        durations = []
+        query_counts = []
+        for iteration in range(self.warmup + self.iterations):
+            client, method, path, kwargs = scenario()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = getattr(client, method)(path, **kwargs)
+                elapsed = time.perf_counter() - started
+            if iteration < self.warmup:
+                continue
+            durations.append(elapsed * 1000)
+            query_counts.append(len(queries))
+
+        return {
+            "method": method.upper(),
+            "path": path,
+            "status": response.status_code,
+            "queries": max(query_counts),
+            "p50_ms": round(percentile(durations, 50), 3),
+            "p99_ms": round(percentile(durations, 99), 3),
+            "mean_ms": round(statistics.fmean(durations), 3),
+        }
+
+    def next_sequence(self):
+        self.sequence += 1
+        return self.sequence
+
+    def issue_tokens(self):
+        refresh = RefreshToken.for_user(self.user)
+        save_refresh_token(self.user.id, str(refresh))
+        return str(refresh.access_token), str(refresh)
+
+    # oauth
+    def oauth_login(self):
+        data = {"phone_number": self.user.phone_number, "password": BENCHMARK_PASSWORD}
+        return self.anonymous, "post", f"{API_PREFIX}/oauth/login/", {"data": data}
+
+    def oauth_refresh(self):
+        self.anonymous.cookies["refresh_token"] = self.refresh_token
+        return self.anonymous, "post", f"{API_PREFIX}/oauth/refresh/", {}
+
+    def oauth_logout(self):
+        # 로그아웃하면 토큰이 폐기되므로 매번 새로 발급
+        access_token, _ = self.issue_tokens()
+        kwargs = {"HTTP_AUTHORIZATION": f"Bearer {access_token}"}
+        return self.anonymous, "post", f"{API_PREFIX}/oauth/logout/", kwargs
+
+    # users
+    def users_create(self):
+        sequence = self.next_sequence()
+        data = {
+            "phone_number": f"018-{sequence // 10000:04d}-{sequence % 10000:04d}",
+            "name": "벤치마크",
+            "gender": "Male",
+            "date_of_birth": "1990-01-01",
+            "address": "서울",
+            "password": BENCHMARK_PASSWORD,
+            "key": "000000",
+        }
+        return self.anonymous, "post", f"{API_PREFIX}/users/", {"data": data}
+
+    def users_info(self):
+        return self.client, "get", f"{API_PREFIX}/users/info/", {}
+
+    def users_update(self):
+        data = {"address": f"서울 {self.next_sequence()}"}
+        return self.client, "patch", f"{API_PREFIX}/users/info/", {"data": data}
+
+    def users_delete(self):
+        # 탈퇴하면 계정을 다시 쓸 수 없으므로 매번 새로 가입
+        sequence = self.next_sequence()
+        user = User.objects.create_user(
+            f"017-{sequence // 10000:04d}-{sequence % 10000:04d}",
+            "탈퇴",
+            "Male",
+            "1990-01-01",
+            "서울",
+            password=BENCHMARK_PASSWORD,
+        )
+        access_token = RefreshToken.for_user(user).access_token
+        kwargs = {"HTTP_AUTHORIZATION": f"Bearer {access_token}"}
+        return self.anonymous, "delete", f"{API_PREFIX}/users/info/", kwargs
+
+    # customers
+    def customers_list(self):
+        return self.client, "get", f"{API_PREFIX}/customers/", {}
+
+    def customers_list_next(self):
+        # 작은 규모에서도 다음 페이지가 있도록 페이지 크기를 줄여 커서를 얻는다
+        if not hasattr(self, "customers_next_link"):
+            params = {"page_size": 5}
+            response = self.client.get(f"{API_PREFIX}/customers/", params)
+            self.customers_next_link = response.data.get("next") or ""
+        return self.client, "get", self.customers_next_link, {}
+
+    def customers_search_choseong(self):
+        params = {"q": self.customer.name_choseong[:2]}
+        return self.client, "get", f"{API_PREFIX}/customers/search/", {"data": params}
+
+    def customers_search_phone(self):
+        params = {"q": self.customer.phone_suffix}
+        return self.client, "get", f"{API_PREFIX}/customers/search/", {"data": params}
+
+    def customers_create(self):
+        data = {
+            "name": "벤치마크",
+            "gender": "Female",
+            "phone_number": "010-0000-0000",
+            "address": "서울",
+        }
+        return self.client, "post", f"{API_PREFIX}/customers/", {"data": data}
+
+    def customers_detail(self):
+        path = f"{API_PREFIX}/customers/{self.customer.id}/"
+        return self.client, "get", path, {}
+
+    def customers_update(self):
+        path = f"{API_PREFIX}/customers/{self.customer.id}/"
+        return self.client, "patch", path, {"data": {"address": "부산"}}
+
+    def customers_delete(self):
+        customer = Customer.objects.create(
+            user=self.user, name="삭제", gender="Male", phone_number="010-0000-0000"
+        )
+        return self.client, "delete", f"{API_PREFIX}/customers/{customer.id}/", {}
+
+    def customers_security(self):
+        path = f"{API_PREFIX}/customers/{self.customer.id}/security/"
+        return self.client, "get", path, {}
+
+    def customers_security_update(self):
+        path = f"{API_PREFIX}/customers/{self.customer.id}/security/"
+        data = {"customer": self.customer.id, "is_korean": True, "key": "123456"}
+        return self.client, "put", path, {"data": data}
+
+    def customers_timeline(self):
+        path = f"{API_PREFIX}/customers/{self.customer.id}/timeline/"
+        return self.client, "get", path, {}
+
+    # counsels
+    def counsels_list(self):
+        return self.client, "get", f"{API_PREFIX}/counsels/", {}
+
+    def counsels_list_filtered(self):
+        params = {"status": "Pending,In Progress", "emergency": "true"}
+        return self.client, "get", f"{API_PREFIX}/counsels/", {"data": params}
+
+    def counsels_search(self):
+        params = {"q": self.counsel.summary.split()[0]}
+        return self.client, "get", f"{API_PREFIX}/counsels/search/", {"data": params}
+
+    def counsels_create(self):
+        data = {
+            "customer": self.customer.id,
+            "summary": "벤치마크 상담",
+            "details": "벤치마크 상담 내용",
+        }
+        return self.client, "post", f"{API_PREFIX}/counsels/", {"data": data}
+
+    def counsels_detail(self):
+        return self.client, "get", f"{API_PREFIX}/counsels/{self.counsel.id}/", {}
+
+    def counsels_update(self):
+        path = f"{API_PREFIX}/counsels/{self.counsel.id}/"
+        return self.client, "patch", path, {"data": {"status": "In Progress"}}
+
+    def counsels_delete(self):
+        counsel = Counsel.objects.create(
+            customer=self.customer, summary="삭제", details="삭제"
+        )
+        return self.client, "delete", f"{API_PREFIX}/counsels/{counsel.id}/", {}
+
+    # documents
+    def documents_list(self):
+        path = f"{API_PREFIX}/counsels/{self.counsel.id}/documents/"
+        return self.client, "get", path, {}
+
+    def documents_create(self):
+        data = {
+            "counsel": self.counsel.id,
+            "summary": "벤치마크 문서",
+            "document": SimpleUploadedFile("benchmark.txt", BENCHMARK_DOCUMENT),
+        }
+        path = f"{API_PREFIX}/counsels/{self.counsel.id}/documents/"
+        return self.client, "post", path, {"data": data, "format": "multipart"}
+
+    def documents_detail(self):
+        document_id = self.document.id if self.document else 0
+        path = f"{API_PREFIX}/counsels/{self.counsel.id}/documents/{document_id}/"
+        return self.client, "get", path, {}
+
+    def documents_update(self):
+        document_id = self.document.id if self.document else 0
+        data = {
+            "summary": "벤치마크 문서 수정",
+            "document": SimpleUploadedFile("benchmark.txt", BENCHMARK_DOCUMENT),
+        }
+        path = f"{API_PREFIX}/counsels/{self.counsel.id}/documents/{document_id}/"
+        return self.client, "put", path, {"data": data, "format": "multipart"}
+
+    def create_document(self, summary):
+        # 업로드 시나리오와 같은 내용이므로 파일을 새로 쓰지 않고 blob 참조만 늘린다
+        blob = DocumentBlob.objects.store(
+            ContentFile(BENCHMARK_DOCUMENT),
+            hashlib.sha256(BENCHMARK_DOCUMENT).hexdigest(),
+            len(BENCHMARK_DOCUMENT),
+        )
+        return CounselDocument.objects.create(
+            counsel=self.counsel, summary=summary, filename=f"{summary}.txt", blob=blob
+        )
+
+    def documents_delete(self):
+        document = self.create_document("삭제")
+        path = f"{API_PREFIX}/counsels/{self.counsel.id}/documents/{document.id}/"
+        return self.client, "delete", path, {}
+
+    def documents_download(self):
+        # 더미 문서는 임시 MEDIA_ROOT 에 파일이 없으므로 측정용 문서를 따로 만든다
+        if not hasattr(self, "download_document"):
+            self.download_document = self.create_document("다운로드")
+        document_id = self.download_document.id
+        path = (
+            f"{API_PREFIX}/counsels/{self.counsel.id}/documents/{document_id}/download/"
+        )
+        return self.client, "get", path, {}
+
+    def documents_search(self):
+        # 벤치마크 중에는 본문 추출 작업이 돌지 않으므로 측정용 본문을 직접 넣는다
+        if not hasattr(self, "document_text"):
+            self.document_text, _ = DocumentText.objects.get_or_create(
+                blob=self.create_document("검색").blob,
+                defaults={"content": BENCHMARK_DOCUMENT.decode()},
+            )
+        params = {"q": BENCHMARK_DOCUMENT.decode().strip()}
+        path = f"{API_PREFIX}/counsels/documents/search/"
+        return self.client, "get", path, {"data": params}
+
+    def documents_thumbnail(self):
+        # 미리보기 생성은 백그라운드 작업이므로 측정하지 않고 썸네일 파일을 직접 붙인다
+        if not hasattr(self, "thumbnail_document"):
+            self.thumbnail_document = self.create_document("썸네일")
+            blob = self.thumbnail_document.blob
+            if not blob.thumbnail:
+                blob.thumbnail.save(
+                    preview_name(blob, "thumbnail", settings.DOCUMENT_THUMBNAIL_SIZE),
+                    ContentFile(BENCHMARK_DOCUMENT),
+                )
+        document_id = self.thumbnail_document.id
+        path = (
+            f"{API_PREFIX}/counsels/{self.counsel.id}/documents/{document_id}"
+            "/previews/thumbnail/"
+        )
+        return self.client, "get", path, {}
+
+    # uploads
+    def create_upload_session(self):
+        return DocumentUploadSession.objects.create(
+            counsel=self.counsel,
+            summary="벤치마크 문서",
+            filename="benchmark.txt",
+            size=len(BENCHMARK_DOCUMENT),
+        )
+
+    def upload_session_path(self, session):
+        return (
+            f"{API_PREFIX}/counsels/{self.counsel.id}/documents/uploads/{session.id}/"
+        )
+
+    def uploads_create(self):
+        data = {
+            "summary": "벤치마크 문서",
+            "filename": "benchmark.txt",
+            "size": len(BENCHMARK_DOCUMENT),
+        }
+        path = f"{API_PREFIX}/counsels/{self.counsel.id}/documents/uploads/"
+        return self.client, "post", path, {"data": data, "format": "json"}
+
+    def uploads_detail(self):
+        if not hasattr(self, "upload_session"):
+            self.upload_session = self.create_upload_session()
+        return self.client, "get", self.upload_session_path(self.upload_session), {}
+
+    def uploads_chunk(self):
+        path = self.upload_session_path(self.create_upload_session())
+        kwargs = {
+            "data": BENCHMARK_DOCUMENT,
+            "content_type": "application/offset+octet-stream",
+            "HTTP_UPLOAD_OFFSET": "0",
+        }
+        return self.client, "patch", path, kwargs
+
+    def uploads_delete(self):
+        path = self.upload_session_path(self.create_upload_session())
+        return self.client, "delete", path, {}
+
+    def uploads_finalize(self):
+        # 청크를 모두 올려 둔 세션을 완료
+        client, method, path, kwargs = self.uploads_chunk()
+        getattr(client, method)(path, **kwargs)
+        return self.client, "post", f"{path}finalize/", {}
+
+    # health
+    def health_db(self):
+        return self.staff_client, "get", f"{API_PREFIX}/health/db/", {}
+
+
+class Command(BaseCommand):
+    help = (
+        "테스트 데이터베이스에 규모별 더미 데이터를 생성하고 모든 API 의 지연 시간(p50/p99)과 "
+        "쿼리 수를 측정합니다. 기준값(baseline)보다 나빠지면 실패합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            nargs="+",
+            choices=list(SCALES),
+            default=["1k"],
+            help="측정할 데이터 규모",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=30, help="엔드포인트별 측정 횟수"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=3, help="측정 전 예열 호출 횟수"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=4, help="더미 데이터 생성 프로세스 수"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="더미 데이터 시드")
+        parser.add_argument(
+            "--report", type=Path, default=DEFAULT_REPORT, help="결과 JSON 경로"
+        )
+        parser.add_argument(
+            "--baseline", type=Path, default=DEFAULT_BASELINE, help="기준값 JSON 경로"
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="이번 결과를 기준값으로 저장",
+        )
+        parser.add_argument(
+            "--latency-tolerance",
+            type=float,
+            default=0.5,
+            help="기준값 대비 허용 지연 시간 증가 비율 (0.5 = 50%%)",
+        )
+        parser.add_argument(
+            "--latency-slack-ms",
+            type=float,
+            default=2.0,
+            help="측정 오차를 고려해 추가로 허용하는 지연 시간(ms)",
+        )
+        parser.add_argument(
+            "--ci",
+            action="store_true",
+            help="기준값이 없거나 다른 데이터베이스에서 측정된 경우에도 실패 (CI 용)",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="테스트 데이터베이스를 삭제하지 않고 재사용",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] <= 0:
+            raise CommandError("--iterations 는 1 이상이어야 합니다.")
+
+        runner = DiscoverRunner(
+            interactive=False, keepdb=options["keepdb"], verbosity=0
+        )
+        runner.setup_test_environment()
+        old_config = runner.setup_databases()
+        # 요청마다 남는 DEBUG 로그가 측정값에 섞이지 않도록 한다
+        logging.disable(logging.DEBUG)
+        # 업로드 파일과 청크는 임시 디렉토리에 저장하고 측정 후 삭제
+        media_root = tempfile.TemporaryDirectory()
+        upload_temp_dir = tempfile.TemporaryDirectory()
+        try:
+            with override_settings(
+                MEDIA_ROOT=media_root.name,
+                DOCUMENT_UPLOAD_TEMP_DIR=upload_temp_dir.name,
+            ):
+                report = self.run_benchmarks(options)
+        finally:
+            media_root.cleanup()
+            upload_temp_dir.cleanup()
+            logging.disable(logging.NOTSET)
+            runner.teardown_databases(old_config)
+            runner.teardown_test_environment()
+
+        self.write_json(options["report"], report)
+        self.stdout.write(f"결과 저장: {options['report']}")
+
+        if options["update_baseline"]:
+            self.write_json(options["baseline"], report)
+            self.stdout.write(self.style.SUCCESS(f"기준값 저장: {options['baseline']}"))
+            return
+
+        regressions = self.compare(report, options)
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(regression)
+            raise CommandError(f"성능 회귀 {len(regressions)}건이 발견되었습니다.")
+        self.stdout.write(self.style.SUCCESS("기준값 대비 성능 회귀가 없습니다."))
+
+    def run_benchmarks(self, options):
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "iterations": options["iterations"],
+            "scales": {},
+        }
+        for scale in options["scale"]:
+            self.stdout.write(f"[{scale}] 더미 데이터 생성 중...")
+            rows = self.seed(scale, options)
+
+            self.stdout.write(f"[{scale}] 엔드포인트 측정 중...")
+            benchmark = EndpointBenchmark(options["iterations"], options["warmup"])
+            endpoints = benchmark.run()
+            for name, result in endpoints.items():
+                self.stdout.write(
+                    f"  {name:<28} {result['status']} "
+                    f"queries={result['queries']:<3} "
+                    f"p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms"
+                )
+            report["scales"][scale] = {"rows": rows, "endpoints": endpoints}
+        return report
+
+    def seed(self, scale, options):
+        call_command("flush", interactive=False, verbosity=0)
+        # 인메모리 SQLite 테스트 DB 는 프로세스 간에 공유되지 않는다
+        workers = 1 if connection.vendor == "sqlite" else options["workers"]
+        call_command(
+            "create_dummy_data",
+            **SCALES[scale],
+            workers=workers,
+            seed=options["seed"],
+            password=BENCHMARK_PASSWORD,
+            stdout=self.stdout,
+        )
+        return {
+            "users": User.objects.count(),
+            "customers": Customer.objects.count(),
+            "counsels": Counsel.objects.count(),
+            "documents": CounselDocument.objects.count(),
+        }
+
+    def compare(self, report, options):
+        """
+        쿼리 수와 응답 코드는 정확히, 지연 시간은 허용 범위 내에서 비교
+        """
+        if not options["baseline"].exists():
+            return self.skip_compare(
+                f"기준값 파일이 없습니다: {options['baseline']} "
+                "(--update-baseline 으로 생성)",
+                options,
+            )
+
+        baseline = json.loads(options["baseline"].read_text())
+        if baseline.get("database") != report["database"]:
+            return self.skip_compare(
+                f"기준값의 데이터베이스({baseline.get('database')})가 "
+                f"측정한 데이터베이스({report['database']})와 다릅니다.",
+                options,
+            )
+
+        regressions = []
+        for scale, current in report["scales"].items():
+            expected_scale = baseline.get("scales", {}).get(scale)
+            if expected_scale is None:
+                self.skip_compare(f"[{scale}] 규모의 기준값이 없습니다.", options)
+                continue
+            for name, expected in expected_scale["endpoints"].items():
+                result = current["endpoints"].get(name)
+                if result is None:
+                    regressions.append(f"[{scale}] {name}: 측정 결과 없음")
+                    continue
+                if result["status"] != expected["status"]:
+                    regressions.append(
+                        f"[{scale}] {name}: 응답 코드 "
+                        f"{expected['status']} -> {result['status']}"
+                    )
+                if result["queries"] > expected["queries"]:
+                    regressions.append(
+                        f"[{scale}] {name}: 쿼리 수 "
+                        f"{expected['queries']} -> {result['queries']}"
+                    )
+                for key in ("p50_ms", "p99_ms"):
+                    limit = (
+                        expected[key] * (1 + options["latency_tolerance"])
+                        + options["latency_slack_ms"]
+                    )
+                    if result[key] > limit:
+                        regressions.append(
+                            f"[{scale}] {name}: {key} "
+                            f"{expected[key]:.2f} -> {result[key]:.2f} "
+                            f"(허용 {limit:.2f})"
+                        )
+        return regressions
+
+    def skip_compare(self, message, options):
+        # CI 에서는 비교하지 못한 것도 실패로 처리해 회귀 검사가 빠지지 않도록 한다
+        if options["ci"]:
+            raise CommandError(message)
+        self.stdout.write(self.style.WARNING(f"{message} 비교를 건너뜁니다."))
+        return []
+
+    def write_json(self, path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n")
@@ -0,0 +1,141 @@
+import re
+from datetime import timedelta
+
+from common.pagination import CreatedAtCursorPagination
+from counsels.models import Counsel
+from customers.models import Customer
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.utils import timezone
+
+# 목록 API 가 순차 스캔하면 안 되는 테이블
+SEQ_SCAN_PATTERN = re.compile(r"Seq Scan on (counsels_counsel|customers_customer)\b")
+# 실행 계획의 각 노드 줄 ("->  Index Scan using ... (cost=...)") 에서 노드 이름 추출
+PLAN_NODE_PATTERN = re.compile(
+    r"^\s*(?:->\s+)?(?P<node>[A-Za-z][A-Za-z ]*?)\s+(?:using|on|\()"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "목록 API 쿼리의 실행 계획을 확인하여 대용량 테이블의 순차 스캔, "
+        "기대한 인덱스 사용 여부, 정렬 노드 발생 여부를 검사합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            help="검사할 사용자 ID (기본값: 고객이 가장 많은 사용자)",
+        )
+        parser.add_argument(
+            "--page-size", type=int, default=50, help="목록 API 페이지 크기"
+        )
+
+    def handle(self, *args, **options):
+        user_id = options["user_id"] or self.get_busiest_user_id()
+        if user_id is None:
+            raise CommandError(
+                "검사할 데이터가 없습니다. 먼저 더미 데이터를 생성하세요."
+            )
+
+        failed = []
+        for name, queryset, indexes, allow_sort in self.get_querysets(
+            user_id, options["page_size"]
+        ):
+            plan = queryset.explain()
+            self.stdout.write(f"[{name}]\n{plan}\n")
+            problems = self.inspect_plan(plan, indexes, allow_sort)
+            if problems:
+                failed.append(f"{name} ({', '.join(problems)})")
+
+        if failed:
+            raise CommandError("실행 계획이 기대와 다른 쿼리:\n" + "\n".join(failed))
+        self.stdout.write("모든 목록 쿼리가 기대한 인덱스를 사용합니다.")
+
+    def inspect_plan(self, plan, indexes, allow_sort):
+        """
+        실행 계획에서 발견한 문제 목록을 반환
+
+        - 대용량 테이블의 순차 스캔
+        - 기대한 인덱스(indexes 중 하나)를 사용하지 않음
+        - LIMIT 바로 아래가 Sort 노드 (인덱스 순서로 읽지 못하고 전부 읽어 정렬)
+        """
+        problems = []
+        if SEQ_SCAN_PATTERN.search(plan):
+            problems.append("순차 스캔")
+        if not any(re.search(rf"\b{index}\b", plan) for index in indexes):
+            problems.append(f"{' 또는 '.join(indexes)} 미사용")
+        if not allow_sort and self.get_top_node(plan) == "Sort":
+            problems.append("정렬 노드")
+        return problems
+
+    def get_top_node(self, plan):
+        """
+        LIMIT 을 제외한 최상위 실행 계획 노드 이름
+        """
+        for line in plan.splitlines():
+            match = PLAN_NODE_PATTERN.match(line)
+            if match and match["node"] != "Limit":
+                return match["node"]
+        return None
+
+    def get_busiest_user_id(self):
+        busiest = (
+            Customer.objects.values("user_id")
+            .annotate(customer_count=Count("id"))
+            .order_by("-customer_count")
+            .first()
+        )
+        return busiest["user_id"] if busiest else None
+
+    def get_querysets(self, user_id, page_size):
+        """
+        목록 API 가 첫 페이지와 다음 페이지(커서)를 조회할 때와 같은 형태의 쿼리
+
+        (이름, 쿼리셋, 기대하는 인덱스 이름들, 정렬 노드 허용 여부) 를 반환합니다.
+        """
+        limit = page_size + 1
+        pagination = CreatedAtCursorPagination()
+        ordering = pagination.get_ordering()
+
+        counsels = Counsel.objects.filter(
+            customer__user_id=user_id, customer__deleted_at__isnull=True
+        ).order_by(*ordering)
+        # 상담에는 user_id 가 없어 사용자 단위로 정렬된 인덱스를 만들 수 없다. 고객이
+        # 많으면 전체 작성일 인덱스를 역순으로 읽으며 고객을 거르고(정렬 없음), 커서가
+        # 깊어지면 고객별 인덱스로 읽어 합친 뒤 정렬한다. 정렬 대상은 그 사용자의
+        # 상담 수로 제한되므로 정렬은 허용하고 인덱스 사용만 확인한다.
+        counsel_indexes = ("counsel_created_id_idx", "counsel_customer_created_idx")
+        yield "counsels", counsels[:limit], counsel_indexes, True
+        yield "counsels:cursor", self.next_page(
+            counsels, pagination, ordering, page_size
+        )[:limit], counsel_indexes, True
+        # "이번 주 미완료 긴급 상담" 필터: 부분 인덱스로 소수의 행만 읽으므로 정렬 허용
+        yield "counsels:open-emergencies", counsels.filter(
+            emergency=True,
+            status__in=["Pending", "In Progress"],
+            created_at__gte=timezone.now() - timedelta(days=7),
+        )[:limit], ("counsel_emergency_idx",), True
+
+        customers = (
+            Customer.objects.filter(user_id=user_id)
+            .select_related("security")
+            .order_by(*ordering)
+        )
+        customer_indexes = ("customer_user_created_idx",)
+        yield "customers", customers[:limit], customer_indexes, False
+        yield "customers:cursor", self.next_page(
+            customers, pagination, ordering, page_size
+        )[:limit], customer_indexes, False
+
+    def next_page(self, queryset, pagination, ordering, page_size):
+        """
+        첫 페이지 마지막 행을 커서로 삼은 다음 페이지 쿼리
+        """
+        position = queryset.values_list("created_at", "id")[
+            page_size - 1 : page_size
+        ].first()
+        if position is None:
+            return queryset
+        return queryset.filter(pagination.get_position_filter(ordering, position))
@@ -0,0 +1,64 @@
+import shutil
+import uuid
+from datetime import timedelta
+from pathlib import Path
+
+from counsels.models import DocumentUploadSession
+from counsels.uploads import discard_upload
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = "오래된 청크 업로드 세션과 세션이 없는 청크 디렉토리를 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ttl",
+            type=int,
+            default=settings.DOCUMENT_UPLOAD_SESSION_TTL,
+            help="마지막 청크 이후 세션을 유지할 시간 (초)",
+        )
+
+    def handle(self, *args, **options):
+        expired_before = timezone.now() - timedelta(seconds=options["ttl"])
+        expired = list(
+            DocumentUploadSession.objects.filter(updated_at__lt=expired_before).only(
+                "id"
+            )
+        )
+        for session in expired:
+            discard_upload(session)
+            session.delete()
+
+        # 상담 기록 삭제 등으로 세션 없이 남은 청크 디렉토리 정리
+        orphans = 0
+        temp_dir = Path(settings.DOCUMENT_UPLOAD_TEMP_DIR)
+        directories = (
+            {path.name: path for path in temp_dir.iterdir() if path.is_dir()}
+            if temp_dir.exists()
+            else {}
+        )
+        active = {
+            str(upload_id)
+            for upload_id in DocumentUploadSession.objects.filter(
+                id__in=[name for name in directories if self.is_uuid(name)]
+            ).values_list("id", flat=True)
+        }
+        for name, path in directories.items():
+            if name in active:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            orphans += 1
+
+        self.stdout.write(
+            f"만료된 업로드 세션 {len(expired)}개, 남은 청크 디렉토리 {orphans}개를 삭제했습니다."
+        )
+
+    def is_uuid(self, name):
+        try:
+            uuid.UUID(name)
+        except ValueError:
+            return False
+        return True
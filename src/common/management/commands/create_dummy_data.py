@@ -1,55 +1,330 @@
+import hashlib
+import multiprocessing
 import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from itertools import islice
 
-from customers.models import Customer
-from django.core.management.base import BaseCommand
+from common.constants.choices import GENDER_CHOICES, STATUS_CHOICES
+from common.search import build_search_document
+from counsels.models import Counsel, CounselDocument, DocumentBlob
+from customers.models import Customer, CustomerSecurity
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
 from faker import Faker
 from users.models import User
 
-# Faker 라이브러리 인스턴스 생성
-faker = Faker("ko_KR")  # 한국어 데이터 생성
+# 더미 유저 전화번호 접두어 (실제 번호와 겹치지 않도록 별도 대역 사용)
+DUMMY_PHONE_PREFIX = "019"
+# 더미 상담 문서가 함께 참조하는 파일 내용
+DUMMY_DOCUMENT_CONTENT = b"dummy document\n"
+# Faker 호출은 느리므로 미리 만들어 둔 값에서 무작위로 선택
+POOL_SIZE = 1000
+
+# 워커 프로세스에서 사용하는 옵션
+WORKER_OPTIONS = ("customers", "counsels", "documents", "batch_size", "days", "blob_id")
+
+GENDERS = [value for value, _ in GENDER_CHOICES]
+STATUSES = [value for value, _ in STATUS_CHOICES]
+
+
+def chunked(iterable, size):
+    """
+    iterable 을 size 개씩 나눈 리스트를 반환하는 제너레이터
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@contextmanager
+def manual_timestamps(*models):
+    """
+    bulk_create 시 created_at 을 직접 지정할 수 있도록 auto_now(_add) 를 잠시 끈다
+    """
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now_add", False) or getattr(field, "auto_now", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class DummyDataFactory:
+    """
+    시드 기반으로 재현 가능한 더미 모델 인스턴스를 만든다
+    """
+
+    def __init__(self, seed, days):
+        self.random = random.Random(seed)
+        faker = Faker("ko_KR")
+        faker.seed_instance(seed)
+        self.names = [faker.name() for _ in range(POOL_SIZE)]
+        self.addresses = [faker.address()[:100] for _ in range(POOL_SIZE)]
+        self.sentences = [faker.sentence() for _ in range(POOL_SIZE)]
+        self.paragraphs = [faker.paragraph(nb_sentences=5) for _ in range(POOL_SIZE)]
+        self.now = timezone.now()
+        self.seconds = max(days, 1) * 24 * 60 * 60
+
+    def timestamp(self):
+        return self.now - timedelta(seconds=self.random.randrange(self.seconds))
+
+    def phone_number(self):
+        return (
+            f"010-{self.random.randint(1000, 9999)}-{self.random.randint(1000, 9999)}"
+        )
+
+    def customer(self, user_id):
+        created_at = self.timestamp()
+        customer = Customer(
+            user_id=user_id,
+            name=self.random.choice(self.names),
+            gender=self.random.choice(GENDERS),
+            phone_number=self.phone_number(),
+            address=self.random.choice(self.addresses),
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        # bulk_create 는 save() 를 호출하지 않으므로 검색용 컬럼을 직접 채운다
+        customer.fill_search_fields()
+        return customer
+
+    def security(self, customer):
+        return CustomerSecurity(
+            customer_id=customer.id,
+            created_at=customer.created_at,
+            updated_at=customer.created_at,
+        )
+
+    def counsel(self, customer):
+        created_at = customer.created_at + (self.now - customer.created_at) * (
+            self.random.random()
+        )
+        summary = self.random.choice(self.sentences)
+        details = self.random.choice(self.paragraphs)
+        return Counsel(
+            customer_id=customer.id,
+            summary=summary,
+            details=details,
+            emergency=self.random.random() < 0.1,
+            status=self.random.choice(STATUSES),
+            search_document=build_search_document(summary, details),
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+    def document(self, counsel, blob_id):
+        return CounselDocument(
+            counsel_id=counsel.id,
+            summary=self.random.choice(self.sentences),
+            blob_id=blob_id,
+            filename="dummy.txt",
+            created_at=counsel.created_at,
+            updated_at=counsel.created_at,
+        )
+
+
+def create_customer_data(user_ids, options, seed):
+    """
+    주어진 유저들의 고객, 고객 보안 정보, 상담 기록, 상담 문서를 생성
+    멀티 프로세스 워커에서도 호출되므로 생성한 행 수만 반환한다.
+    """
+    factory = DummyDataFactory(seed, options["days"])
+    batch_size = options["batch_size"]
+    counts = {"customers": 0, "counsels": 0, "documents": 0}
+
+    with manual_timestamps(Customer, CustomerSecurity, Counsel, CounselDocument):
+        for user_id in user_ids:
+            customers = (factory.customer(user_id) for _ in range(options["customers"]))
+            for customer_batch in chunked(customers, batch_size):
+                # 고객과 고객 보안 정보는 항상 함께 존재하도록 한 트랜잭션으로 생성
+                with transaction.atomic():
+                    Customer.objects.bulk_create(customer_batch)
+                    CustomerSecurity.objects.bulk_create(
+                        [factory.security(customer) for customer in customer_batch]
+                    )
+                counsel_count, document_count = create_counsel_data(
+                    factory, customer_batch, options, batch_size
+                )
+                counts["customers"] += len(customer_batch)
+                counts["counsels"] += counsel_count
+                counts["documents"] += document_count
+    return counts
+
+
+def create_counsel_data(factory, customers, options, batch_size):
+    """
+    고객 묶음에 대한 상담 기록과 상담 문서를 생성하고 (상담 수, 문서 수) 를 반환
+    """
+    counsel_count = document_count = 0
+    counsels = (
+        factory.counsel(customer)
+        for customer in customers
+        for _ in range(options["counsels"])
+    )
+    for counsel_batch in chunked(counsels, batch_size):
+        Counsel.objects.bulk_create(counsel_batch)
+        counsel_count += len(counsel_batch)
+
+        documents = (
+            factory.document(counsel, options["blob_id"])
+            for counsel in counsel_batch
+            for _ in range(options["documents"])
+        )
+        for document_batch in chunked(documents, batch_size):
+            CounselDocument.objects.bulk_create(document_batch)
+            document_count += len(document_batch)
+    return counsel_count, document_count
+
+
+def run_worker(args):
+    """
+    워커 프로세스 진입점
+    """
+    user_ids, options, seed = args
+    try:
+        return create_customer_data(user_ids, options, seed)
+    finally:
+        connections.close_all()
 
 
 class Command(BaseCommand):
-    help = "유저와 고객 더미 데이터를 생성합니다."
+    help = "유저, 고객, 상담 기록, 상담 문서 더미 데이터를 대량으로 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=30, help="생성할 유저 수")
+        parser.add_argument("--customers", type=int, default=30, help="유저당 고객 수")
+        parser.add_argument(
+            "--counsels", type=int, default=0, help="고객당 상담 기록 수"
+        )
+        parser.add_argument(
+            "--documents", type=int, default=0, help="상담 기록당 상담 문서 수"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="bulk_create 배치 크기"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="고객 이하 데이터를 생성할 프로세스 수",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="난수 시드 (같은 시드면 같은 데이터)"
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="생성 시각을 분산할 기간 (최근 N일)",
+        )
+        parser.add_argument(
+            "--password", default="password123", help="더미 유저 공통 비밀번호"
+        )
 
-    def handle(self, *args, **kwargs):
+    def handle(self, *args, **options):
+        for name in ("users", "customers", "counsels", "documents"):
+            if options[name] < 0:
+                raise CommandError(f"--{name} 는 0 이상이어야 합니다.")
+        if options["batch_size"] <= 0 or options["workers"] <= 0:
+            raise CommandError("--batch-size 와 --workers 는 1 이상이어야 합니다.")
+
+        started = time.monotonic()
         self.stdout.write("더미 데이터 생성을 시작합니다...")
-        self.create_dummy_users_and_customers()
-
-    def create_dummy_users_and_customers(self):
-        try:
-            # 유저 생성
-            users = []
-            for i in range(30):
-                phone_number = (
-                    f"010-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
-                )
-                user = User.objects.create_user(
-                    phone_number=phone_number,
-                    name=faker.name(),
-                    gender=random.choice(["Male", "Female"]),
-                    date_of_birth=faker.date_of_birth(),
-                    address=faker.address(),
-                    password="password123",
-                )
-                users.append(user)
-                self.stdout.write(f"유저 생성 완료: {user.phone_number}")
-
-            # 고객 생성
-            for user in users:
-                for j in range(30):
-                    customer = Customer.objects.create(
-                        user=user,
-                        name=faker.name(),
-                        gender=random.choice(["Male", "Female"]),
-                        phone_number=f"010-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}",
-                        address=faker.address(),
-                    )
-                    self.stdout.write(
-                        f"고객 생성 완료: {customer.name}, {customer.phone_number}"
-                    )
 
-            self.stdout.write("더미 데이터 생성이 완료되었습니다!")
+        user_ids = self.create_users(options)
+        self.stdout.write(f"유저 생성 완료: {len(user_ids)}명")
+        blob = None
+        if options["documents"] and options["counsels"]:
+            blob = self.create_dummy_blob()
+        options["blob_id"] = blob.id if blob else None
+
+        counts = self.create_customer_data(user_ids, options)
+        if blob is not None:
+            # bulk_create 는 참조 수를 늘리지 않으므로 한 번에 다시 계산
+            DocumentBlob.objects.filter(pk=blob.pk).update(
+                ref_count=CounselDocument.objects.filter(blob=blob).count()
+            )
+
+        elapsed = time.monotonic() - started
+        total = len(user_ids) + sum(counts.values())
+        self.stdout.write(
+            f"고객 {counts['customers']}명, 상담 기록 {counts['counsels']}건, "
+            f"상담 문서 {counts['documents']}건 생성"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"더미 데이터 생성이 완료되었습니다! "
+                f"({elapsed:.1f}초, 초당 {total / max(elapsed, 0.001):.0f}행)"
+            )
+        )
 
-        except Exception as e:
-            self.stderr.write(f"오류 발생: {e}")
+    def create_users(self, options):
+        """
+        비밀번호 해시는 한 번만 계산하여 모든 더미 유저가 공유
+        """
+        factory = DummyDataFactory(options["seed"], options["days"])
+        password = make_password(options["password"])
+        start = User.objects.filter(
+            phone_number__startswith=f"{DUMMY_PHONE_PREFIX}-"
+        ).count()
+        users = (
+            User(
+                phone_number=f"{DUMMY_PHONE_PREFIX}-{index // 10000:04d}-{index % 10000:04d}",
+                password=password,
+                name=factory.random.choice(factory.names)[:25],
+                gender=factory.random.choice(GENDERS),
+                date_of_birth=factory.timestamp().date() - timedelta(days=365 * 30),
+                address=factory.random.choice(factory.addresses),
+            )
+            for index in range(start, start + options["users"])
+        )
+        user_ids = []
+        for batch in chunked(users, options["batch_size"]):
+            user_ids.extend(user.id for user in User.objects.bulk_create(batch))
+        return user_ids
+
+    def create_dummy_blob(self):
+        sha256 = hashlib.sha256(DUMMY_DOCUMENT_CONTENT).hexdigest()
+        return DocumentBlob.objects.store(
+            ContentFile(DUMMY_DOCUMENT_CONTENT), sha256, len(DUMMY_DOCUMENT_CONTENT)
+        )
+
+    def create_customer_data(self, user_ids, options):
+        seed = options["seed"]
+        workers = min(options["workers"], len(user_ids)) or 1
+        # 워커 프로세스로 넘길 수 있도록 생성에 필요한 옵션만 추린다
+        options = {key: options[key] for key in WORKER_OPTIONS}
+        # 워커마다 다른 시드를 사용하되 워커 수가 같으면 결과가 재현되도록 고정
+        tasks = [
+            (user_ids[index::workers], options, seed + index + 1)
+            for index in range(workers)
+        ]
+        if workers == 1:
+            return create_customer_data(*tasks[0])
+
+        # fork 한 자식 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫는다
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        counts = {"customers": 0, "counsels": 0, "documents": 0}
+        with context.Pool(workers) as pool:
+            for result in pool.imap_unordered(run_worker, tasks):
+                for key, value in result.items():
+                    counts[key] += value
+                self.stdout.write(
+                    f"워커 완료: 고객 {result['customers']}명, "
+                    f"상담 기록 {result['counsels']}건"
+                )
+        return counts
@@ -0,0 +1,21 @@
+from common.jobs import enqueue
+from counsels.jobs import extract_document_text
+from counsels.models import DocumentBlob
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = "본문을 아직 추출하지 않은 상담 문서 파일의 추출 작업을 큐에 넣습니다."
+
+    def handle(self, *args, **options):
+        # 추출 작업이 생기기 전에 올린 파일처럼 본문이 없는 blob 만 대상
+        blob_ids = DocumentBlob.objects.filter(text__isnull=True).values_list(
+            "id", flat=True
+        )
+        count = 0
+        with transaction.atomic():
+            for blob_id in blob_ids.iterator():
+                enqueue(extract_document_text, blob_id=blob_id)
+                count += 1
+        self.stdout.write(f"본문 추출 작업 {count}개를 큐에 넣었습니다.")
@@ -0,0 +1,19 @@
+from common.jobs import enqueue
+from counsels.jobs import generate_document_previews
+from counsels.models import DocumentBlob
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = "상담 문서 파일의 미리보기 생성 작업을 큐에 넣습니다."
+
+    def handle(self, *args, **options):
+        # 미리보기 작업이 생기기 전에 올린 파일, 크기 설정이 바뀐 미리보기가 대상
+        # (이미 같은 크기로 만든 미리보기는 작업에서 건너뛴다)
+        count = 0
+        with transaction.atomic():
+            for blob_id in DocumentBlob.objects.values_list("id", flat=True).iterator():
+                enqueue(generate_document_previews, blob_id=blob_id)
+                count += 1
+        self.stdout.write(f"미리보기 생성 작업 {count}개를 큐에 넣었습니다.")
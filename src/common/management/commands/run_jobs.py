@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+
+from common.jobs import (autodiscover, delete_finished_jobs, registry,
+                         requeue_stale_jobs, work_loop)
+from common.logging_config import get_logger
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+# 공통 로거 가져오기
+logger = get_logger()
+
+# 중단된 작업 복구, 완료 작업 정리 간격(초)
+MAINTENANCE_INTERVAL = 60
+
+
+class Command(BaseCommand):
+    help = "백그라운드 작업 큐의 작업을 스레드 또는 프로세스 워커로 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="워커 수")
+        parser.add_argument(
+            "--pool",
+            choices=["thread", "process"],
+            default="thread",
+            help="워커 종류 (I/O 위주 작업은 thread, CPU 위주 작업은 process)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.JOB_POLL_INTERVAL,
+            help="실행할 작업이 없을 때 다시 확인하는 간격(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기 중인 작업을 모두 실행하면 종료",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] <= 0:
+            raise CommandError("--workers 는 1 이상이어야 합니다.")
+
+        autodiscover()
+        self.stdout.write(f"등록된 작업: {', '.join(sorted(registry)) or '없음'}")
+
+        # 오래 멈춰 있던 작업을 먼저 되돌린 뒤 시작
+        self.maintain()
+        workers = self.start_workers(options)
+        self.stdout.write(
+            f"{options['pool']} 워커 {len(workers)}개로 작업을 실행합니다."
+        )
+
+        last_maintenance = time.monotonic()
+        while any(worker.is_alive() for worker in workers):
+            self.stop.wait(options["poll_interval"])
+            if time.monotonic() - last_maintenance >= MAINTENANCE_INTERVAL:
+                self.maintain()
+                last_maintenance = time.monotonic()
+        for worker in workers:
+            worker.join()
+        self.stdout.write("작업 실행을 종료합니다.")
+
+    def start_workers(self, options):
+        """
+        SIGINT / SIGTERM 을 받으면 실행 중인 작업을 마친 뒤 종료하도록 stop 이벤트를 공유
+        """
+        if options["pool"] == "process":
+            context = multiprocessing.get_context("fork")
+            self.stop = context.Event()
+            worker_class = context.Process
+            # fork 한 자식 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫는다
+            connections.close_all()
+        else:
+            self.stop = threading.Event()
+            worker_class = threading.Thread
+
+        # 자식 프로세스도 같은 핸들러를 물려받아 stop 만 설정한다
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: self.stop.set())
+
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        workers = [
+            worker_class(
+                target=work_loop,
+                args=(
+                    f"{prefix}-{index}",
+                    self.stop,
+                    options["poll_interval"],
+                    options["once"],
+                ),
+                daemon=True,
+            )
+            for index in range(options["workers"])
+        ]
+        for worker in workers:
+            worker.start()
+        return workers
+
+    def maintain(self):
+        requeue_stale_jobs(settings.JOB_LOCK_TIMEOUT)
+        deleted = delete_finished_jobs(settings.JOB_RETENTION)
+        if deleted:
+            logger.info("완료된 작업 정리", deleted=deleted)
@@ -0,0 +1,154 @@
+import cProfile
+import random
+import time
+import uuid
+from contextlib import ExitStack
+
+from common.authentication import StatelessJWTAuthentication
+from common.logging_config import LOG_DIR, get_logger
+from common.performance import RequestTimings, current_timings
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from rest_framework.exceptions import APIException
+
+# 공통 로거 가져오기
+logger = get_logger()
+
+
+class PerformanceMiddleware:
+    """
+    요청별 DB 시간, 쿼리 수, 시리얼라이저 시간, 뷰 처리 시간을 측정
+
+    측정값은 Server-Timing 헤더와 한 줄의 로그로 남긴다.
+    PERFORMANCE_SAMPLE_RATE (0.0 ~ 1.0) 비율의 요청만 측정한다.
+    MIDDLEWARE 의 마지막에 두어 뷰 처리 시간만 측정되도록 한다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "PERFORMANCE_SAMPLE_RATE", 1.0)
+
+    def __call__(self, request):
+        if self.sample_rate <= 0 or (
+            self.sample_rate < 1 and random.random() >= self.sample_rate
+        ):
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings))
+                started = time.perf_counter()
+                response = self.get_response(request)
+                # 응답 본문 렌더링(JSON 인코딩)까지 뷰 처리 시간에 포함
+                if hasattr(response, "render") and callable(response.render):
+                    response.render()
+                view_time = time.perf_counter() - started
+        finally:
+            current_timings.reset(token)
+
+        response["Server-Timing"] = self.server_timing(timings, view_time)
+        logger.info(
+            "performance",
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+            view_ms=round(view_time * 1000, 2),
+            db_ms=round(timings.db_time * 1000, 2),
+            queries=timings.query_count,
+            serializer_ms=round(timings.serializer_time * 1000, 2),
+        )
+        return response
+
+    def server_timing(self, timings, view_time):
+        return ", ".join(
+            [
+                f'db;dur={timings.db_time * 1000:.2f};desc="{timings.query_count} queries"',
+                f"serializer;dur={timings.serializer_time * 1000:.2f}",
+                f"view;dur={view_time * 1000:.2f}",
+            ]
+        )
+
+
+class ProfilingMiddleware:
+    """
+    스태프 사용자가 요청한 경우에만 뷰 처리 전체를 cProfile 로 프로파일링
+
+    X-Profile 헤더 또는 _profile 쿼리 파라미터로 요청하면
+    LOG_DIR/profiles/<id>.prof (pstats 형식) 로 저장하고 X-Profile-Id 헤더로 id 를 반환한다.
+    저장된 파일은 snakeviz, flameprof 등으로 플레임그래프를 만들 수 있다.
+    디스크가 차지 않도록 PROFILE_MAX_FILES 개를 넘으면 오래된 파일부터 삭제한다.
+    """
+
+    header = "X-Profile"
+    query_param = "_profile"
+    response_header = "X-Profile-Id"
+    profile_dir = LOG_DIR / "profiles"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "PROFILING_ENABLED", True)
+        self.max_files = getattr(settings, "PROFILE_MAX_FILES", 100)
+
+    def __call__(self, request):
+        if not (self.enabled and self.is_requested(request)):
+            return self.get_response(request)
+        if not self.is_staff(request):
+            logger.warning(
+                "프로파일링 요청 무시: 스태프가 아닌 사용자", path=request.path
+            )
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        response = profiler.runcall(self.get_response, request)
+        if hasattr(response, "render") and callable(response.render):
+            response = profiler.runcall(response.render)
+
+        profile_id = f"{timezone.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(self.profile_dir / f"{profile_id}.prof")
+        self.prune_profiles()
+        response[self.response_header] = profile_id
+        logger.info(
+            "프로파일 저장",
+            profile_id=profile_id,
+            method=request.method,
+            path=request.path,
+        )
+        return response
+
+    def prune_profiles(self):
+        """
+        최근 max_files 개만 남기고 오래된 프로파일 파일 삭제
+        """
+        profiles = sorted(
+            self.profile_dir.glob("*.prof"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in profiles[self.max_files :]:
+            # 다른 워커가 먼저 지웠을 수 있다
+            path.unlink(missing_ok=True)
+
+    def is_requested(self, request):
+        return bool(
+            request.headers.get(self.header) or request.GET.get(self.query_param)
+        )
+
+    def is_staff(self, request):
+        """
+        세션(관리자 페이지) 또는 JWT 로 인증된 스태프 사용자인지 확인
+        JWT 인증은 DRF 뷰에서 이루어지므로 여기서 한 번 더 검증한다.
+        """
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated and user.is_staff:
+            return True
+
+        try:
+            result = StatelessJWTAuthentication().authenticate(request)
+            return result is not None and result[0].is_staff
+        except APIException:
+            return False
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.15 on 2026-10-17 07:30
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_tables(apps, schema_editor):
+    """
+    settings.CACHES 의 DatabaseCache 테이블(crm_cache, crm_token_cache) 생성
+
+    이미 있는 테이블은 건너뛰고, Redis 등 다른 캐시 백엔드는 대상이 아니다.
+    """
+    call_command(
+        "createcachetable", database=schema_editor.connection.alias, verbosity=0
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_tables, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+from common.constants.choices import JOB_STATUS_CHOICES
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    백그라운드 작업 큐의 작업 (common.jobs 로 등록, 실행)
+    """
+
+    name = models.CharField(max_length=200)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=20, choices=JOB_STATUS_CHOICES, default="pending"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # 워커가 실행할 작업을 가져오는 쿼리용 부분 인덱스
+            models.Index(
+                fields=["run_at", "id"],
+                name="job_pending_idx",
+                condition=models.Q(status="pending"),
+            ),
+            # 워커가 죽어 실행 중으로 남은 작업을 찾는 쿼리용
+            models.Index(
+                fields=["locked_at"],
+                name="job_running_idx",
+                condition=models.Q(status="running"),
+            ),
+            # 오래된 완료 작업 정리용
+            models.Index(
+                fields=["updated_at"],
+                name="job_done_idx",
+                condition=models.Q(status="done"),
+            ),
+        ]
@@ -0,0 +1,387 @@
+import base64
+import binascii
+import heapq
+import json
+from collections import OrderedDict
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class LinkPagination(BasePagination):
+    """
+    next / previous 링크와 results 로 응답하는 페이지네이션 기반 클래스
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        raise NotImplementedError
+
+    def get_previous_link(self):
+        raise NotImplementedError
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size_schema_parameter(self):
+        return {
+            "name": self.page_size_query_param,
+            "required": False,
+            "in": "query",
+            "description": "페이지당 항목 수",
+            "schema": {"type": "integer"},
+        }
+
+
+class KeysetPagination(LinkPagination):
+    """
+    키셋(커서) 기반 페이지네이션
+
+    ordering 에 지정한 필드 값의 조합을 커서로 사용하여 OFFSET 스캔이나
+    COUNT(*) 없이 다음/이전 페이지를 조회합니다. 마지막 필드는 유일해야 합니다.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+        self.base_url = request.build_absolute_uri()
+
+        cursor = self.decode_cursor(request)
+        self.reverse = bool(cursor and cursor["reverse"])
+
+        ordering = self.get_ordering(self.reverse)
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(
+                self.get_position_filter(ordering, cursor["position"])
+            )
+
+        # 한 건 더 조회하여 다음 페이지 존재 여부를 판단 (COUNT 쿼리 없음)
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next = cursor is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_ordering(self, reverse=False):
+        if not reverse:
+            return list(self.ordering)
+        return [
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        ]
+
+    def get_position_filter(self, ordering, position):
+        """
+        (a, b) < (x, y) 형태의 행 비교를 Q 객체로 변환
+
+        a < x OR (a = x AND b < y) 만으로는 PostgreSQL 이 인덱스의 범위 조건으로 쓰지
+        못해 인덱스를 처음부터 읽으므로, 같은 뜻인 a <= x 를 AND 로 함께 건다.
+        """
+        position_filter = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition = Q(**{f"{name}__{lookup}": position[index]})
+            for prev_field, prev_value in zip(ordering[:index], position[:index]):
+                condition &= Q(**{prev_field.lstrip("-"): prev_value})
+            position_filter |= condition
+
+        first = ordering[0]
+        lookup = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{lookup}": position[0]}) & position_filter
+
+    def get_position(self, instance):
+        return [
+            self.model._meta.get_field(field.lstrip("-")).value_to_string(instance)
+            for field in self.ordering
+        ]
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            position = [
+                self.model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, payload["p"], strict=True)
+            ]
+            return {"reverse": bool(payload["r"]), "position": position}
+        except (binascii.Error, ValidationError, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance, reverse):
+        payload = {"r": int(reverse), "p": self.get_position(instance)}
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "페이지 커서",
+                "schema": {"type": "string"},
+            },
+            self.get_page_size_schema_parameter(),
+        ]
+
+
+class CreatedAtCursorPagination(KeysetPagination):
+    """
+    (created_at, id) 역순 커서 페이지네이션
+    """
+
+    ordering = ("-created_at", "-id")
+
+
+class MergedCreatedAtCursorPagination(LinkPagination):
+    """
+    여러 모델의 목록을 하나로 합친 (created_at, 종류, id) 역순 커서 페이지네이션
+
+    paginate_queryset 에 {종류: queryset} 을 넘기면 (종류, 객체) 목록을 반환한다.
+    종류마다 커서 이후 page_size + 1 건만 조회한 뒤 heapq.merge 로 합치므로
+    쿼리 수는 종류 수와 같고, OFFSET 스캔이나 COUNT(*) 가 없다.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, querysets, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        cursor = self.decode_cursor(request, querysets)
+        self.reverse = bool(cursor and cursor["reverse"])
+
+        prefix = "" if self.reverse else "-"
+        streams = []
+        for kind, queryset in querysets.items():
+            queryset = queryset.order_by(f"{prefix}created_at", f"{prefix}id")
+            if cursor:
+                queryset = queryset.filter(
+                    self.get_position_filter(kind, cursor["position"])
+                )
+            streams.append(
+                [
+                    ((instance.created_at, kind, instance.pk), instance)
+                    for instance in queryset[: self.page_size + 1]
+                ]
+            )
+
+        # 각 목록이 이미 같은 순서로 정렬되어 있으므로 앞에서부터 합친다
+        merged = heapq.merge(
+            *streams, key=lambda item: item[0], reverse=not self.reverse
+        )
+        results = [
+            (key[1], instance) for key, instance in islice(merged, self.page_size + 1)
+        ]
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next = cursor is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_position_filter(self, kind, position):
+        """
+        (created_at, 종류, id) 가 커서보다 뒤(역방향이면 앞)인 행의 조건
+
+        KeysetPagination 과 마찬가지로 created_at 범위 조건을 AND 로 함께 걸어
+        인덱스를 커서 위치부터 읽게 한다.
+        """
+        created_at, cursor_kind, pk = position
+        lookup = "gt" if self.reverse else "lt"
+        bound = Q(**{f"created_at__{lookup}e": created_at})
+        condition = Q(**{f"created_at__{lookup}": created_at})
+        if kind == cursor_kind:
+            condition |= Q(created_at=created_at, **{f"id__{lookup}": pk})
+        elif (kind < cursor_kind) != self.reverse:
+            # 시각이 같으면 종류 이름 순서로 정렬되므로 같은 시각의 행은 모두 포함
+            condition |= Q(created_at=created_at)
+        return bound & condition
+
+    def decode_cursor(self, request, querysets):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            created_at, kind, pk = payload["p"]
+            created_at = parse_datetime(created_at)
+            if created_at is None or kind not in querysets:
+                raise ValueError
+            return {
+                "reverse": bool(payload["r"]),
+                "position": [created_at, kind, int(pk)],
+            }
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, item, reverse):
+        kind, instance = item
+        payload = {
+            "r": int(reverse),
+            "p": [instance.created_at.isoformat(), kind, instance.pk],
+        }
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "페이지 커서",
+                "schema": {"type": "string"},
+            },
+            self.get_page_size_schema_parameter(),
+        ]
+
+
+class PageNumberWithoutCountPagination(LinkPagination):
+    """
+    COUNT(*) 없이 동작하는 페이지 번호 페이지네이션
+
+    검색 결과처럼 키셋으로 정렬할 수 없는 목록에 사용한다.
+    깊은 OFFSET 스캔을 막기 위해 조회 가능한 페이지 수를 제한한다.
+    """
+
+    page_query_param = "page"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    max_page = 50
+    invalid_page_message = "유효하지 않은 페이지입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+        if not 1 <= self.page_number <= self.max_page:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (self.page_number - 1) * self.page_size
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.has_next = (
+            len(results) > self.page_size and self.page_number < self.max_page
+        )
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.page_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"페이지 번호 (최대 {self.max_page})",
+                "schema": {"type": "integer"},
+            },
+            self.get_page_size_schema_parameter(),
+        ]
@@ -0,0 +1,48 @@
+import time
+from contextvars import ContextVar
+
+# 샘플링된 요청에서만 값이 설정된다 (None 이면 측정하지 않음)
+current_timings = ContextVar("current_timings", default=None)
+
+
+class RequestTimings:
+    """
+    한 요청 동안 누적되는 DB / 시리얼라이저 소요 시간
+    """
+
+    __slots__ = ("db_time", "query_count", "serializer_time", "serializer_depth")
+
+    def __init__(self):
+        self.db_time = 0.0
+        self.query_count = 0
+        self.serializer_time = 0.0
+        # 중첩된 시리얼라이저가 시간을 중복 집계하지 않도록 깊이를 기록
+        self.serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        connection.execute_wrapper 로 등록되어 모든 쿼리의 실행 시간을 측정
+        """
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.query_count += 1
+
+
+def timed_serializer_call(method, *args, **kwargs):
+    """
+    현재 요청이 측정 중이면 시리얼라이저 메서드 실행 시간을 누적
+    """
+    timings = current_timings.get()
+    if timings is None or timings.serializer_depth:
+        return method(*args, **kwargs)
+
+    timings.serializer_depth += 1
+    started = time.perf_counter()
+    try:
+        return method(*args, **kwargs)
+    finally:
+        timings.serializer_time += time.perf_counter() - started
+        timings.serializer_depth -= 1
@@ -0,0 +1,52 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+
+# PostgreSQL 에는 한국어 형태소 분석기가 없으므로 2-gram 으로 토큰화하여
+# 'simple' 설정의 tsvector 로 색인한다. (예: "상담내용" -> "상담 담내 내용")
+SEARCH_CONFIG = "simple"
+NGRAM_SIZE = 2
+MIN_QUERY_LENGTH = NGRAM_SIZE
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def ngram_tokens(text, size=NGRAM_SIZE):
+    """
+    문자열을 단어 단위로 나눈 뒤 각 단어를 n-gram 토큰으로 분해
+    n 보다 짧은 단어는 그대로 토큰으로 사용한다.
+    """
+    tokens = []
+    for word in WORD_PATTERN.findall((text or "").lower()):
+        if len(word) <= size:
+            tokens.append(word)
+            continue
+        tokens.extend(word[i : i + size] for i in range(len(word) - size + 1))
+    return tokens
+
+
+def build_search_document(*texts):
+    """
+    검색 색인 컬럼에 저장할 토큰 문자열
+    """
+    return " ".join(token for text in texts for token in ngram_tokens(text))
+
+
+def build_search_query(text):
+    """
+    검색어의 모든 토큰을 포함하는 문서를 찾는 SearchQuery
+    유효한 토큰이 없으면 None 을 반환한다.
+    """
+    tokens = dict.fromkeys(ngram_tokens(text))
+    if not tokens:
+        return None
+    # 토큰은 \w 문자로만 구성되므로 따옴표로 감싸 그대로 tsquery 로 사용
+    raw_query = " & ".join(f"'{token}'" for token in tokens)
+    return SearchQuery(raw_query, config=SEARCH_CONFIG, search_type="raw")
+
+
+def search_vector(field_name):
+    """
+    색인 컬럼의 tsvector 식 (GinIndex 식과 동일해야 인덱스를 사용)
+    """
+    return SearchVector(field_name, config=SEARCH_CONFIG)
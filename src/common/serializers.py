@@ -0,0 +1,13 @@
+from common.performance import timed_serializer_call
+
+
+class TimedSerializerMixin:
+    """
+    검증(is_valid)과 직렬화(to_representation) 시간을 성능 측정에 포함시키는 믹스인
+    """
+
+    def is_valid(self, *args, **kwargs):
+        return timed_serializer_call(super().is_valid, *args, **kwargs)
+
+    def to_representation(self, instance):
+        return timed_serializer_call(super().to_representation, instance)
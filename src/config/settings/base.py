@@ -55,6 +55,9 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    # 뷰 처리 시간만 측정하도록 마지막에 위치
+    "common.middleware.PerformanceMiddleware",
+    "common.middleware.ProfilingMiddleware",
 ]
 
 CORS_ALLOW_CREDENTIALS = True
@@ -97,6 +100,26 @@ AUTH_USER_MODEL = "users.User"
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# 여러 워커가 같은 값을 봐야 하므로 프로세스별 LocMemCache 대신 DB 캐시를 기본으로 사용
+# (캐시 테이블은 common 앱의 마이그레이션에서 생성)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "crm_cache",
+        "KEY_PREFIX": "crm",
+    },
+    # Refresh Token 저장용
+    "tokens": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "crm_token_cache",
+        "KEY_PREFIX": "crm:tokens",
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -141,14 +164,32 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 요청마다 사용자 조회를 하지 않는 토큰 기반 인증
+        "common.authentication.StatelessJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
         "rest_framework.permissions.IsAuthenticated",  # 기본적으로 인증된 사용자만 허용
     ],
+    # 오류 로그를 (경로, 코드) 별로 묶어서 남기는 예외 처리기
+    "EXCEPTION_HANDLER": "common.exceptions.custom_exception_handler",
 }
+# 같은 (경로, 코드) 오류 로그를 한 번만 남기고 생략된 개수를 요약하는 간격(초)
+ERROR_LOG_THROTTLE_SECONDS = 60
+
+# 백그라운드 작업 큐 (python manage.py run_jobs)
+# 실행할 작업이 없을 때 다시 확인하는 간격(초)
+JOB_POLL_INTERVAL = 1
+# 이 시간(초)을 넘게 실행 중인 작업은 워커가 죽은 것으로 보고 다시 실행
+JOB_LOCK_TIMEOUT = 10 * 60
+# 완료된 작업을 보관하는 기간(초)
+JOB_RETENTION = 7 * 24 * 60 * 60
+# 고객 / 회원 삭제 작업이 한 번에 지우는 행 수
+PURGE_BATCH_SIZE = 500
+
 SIMPLE_JWT = {
+    # 요청마다 사용자를 조회하지 않으므로(StatelessJWTAuthentication) 비활성화, 탈퇴한
+    # 사용자의 Access Token 도 만료될 때까지 쓸 수 있다. 짧게 유지할 것
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "BLACKLIST_AFTER_ROTATION": True,
@@ -168,3 +209,26 @@ SPECTACULAR_SETTINGS = {
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+
+# 상담 문서 업로드 제한 (파일당 최대 크기, 사용자별 총 용량)
+DOCUMENT_MAX_UPLOAD_SIZE = 100 * 1024 * 1024
+DOCUMENT_USER_QUOTA = 5 * 1024 * 1024 * 1024
+
+# 이어 올리기(청크) 업로드 설정 (청크 임시 저장 위치, 청크당 최대 크기, 세션 유지 시간)
+DOCUMENT_UPLOAD_TEMP_DIR = BASE_DIR / "uploads"
+DOCUMENT_UPLOAD_MAX_CHUNK_SIZE = 10 * 1024 * 1024
+DOCUMENT_UPLOAD_SESSION_TTL = 24 * 60 * 60
+
+# 상담 문서 다운로드 전송 방식
+# "django": Django 가 직접 전송 (Range, 조건부 요청 지원)
+# "x-accel-redirect": nginx 가 전송 (DOCUMENT_DOWNLOAD_ACCEL_PREFIX 를 MEDIA_ROOT 에 연결한 internal location 필요)
+# "x-sendfile": Apache mod_xsendfile 등이 전송
+DOCUMENT_DOWNLOAD_BACKEND = "django"
+DOCUMENT_DOWNLOAD_ACCEL_PREFIX = "/protected-media/"
+
+# 상담 문서에서 추출해 검색 색인에 저장하는 본문 최대 글자 수
+DOCUMENT_TEXT_MAX_LENGTH = 100_000
+
+# 이미지 상담 문서의 미리보기 크기 (긴 변 기준 픽셀)
+DOCUMENT_THUMBNAIL_SIZE = 200
+DOCUMENT_PREVIEW_SIZE = 800
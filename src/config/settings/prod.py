@@ -13,6 +13,7 @@ SECRET_KEY = ENV.get(
 
 
 # Database
+# 커넥션을 POSTGRES_CONN_MAX_AGE 초 동안 재사용
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -21,10 +22,48 @@ DATABASES = {
         "PASSWORD": ENV.get("POSTGRES_PASSWORD", "postgres"),
         "NAME": ENV.get("POSTGRES_DBNAME", "postgres"),
         "PORT": ENV.get("POSTGRES_PORT", 5432),
+        "CONN_MAX_AGE": int(ENV.get("POSTGRES_CONN_MAX_AGE", 60)),
+        # 재사용 전 커넥션 상태 확인
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
 
+# Cache
+# REDIS_URL 이 지정되면 Redis 를 공유 캐시로 사용 (redis 패키지 필요)
+REDIS_URL = ENV.get("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "crm",
+        },
+        "tokens": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "crm:tokens",
+        },
+    }
+
+
+# Performance
+# 성능 측정(Server-Timing 헤더, 성능 로그) 대상 요청 비율 (0.0 ~ 1.0)
+PERFORMANCE_SAMPLE_RATE = float(ENV.get("PERFORMANCE_SAMPLE_RATE", 0.1))
+# 스태프 사용자의 요청별 cProfile 프로파일링 허용 여부 (운영에서는 필요할 때만 켠다)
+PROFILING_ENABLED = ENV.get("PROFILING_ENABLED", "false").lower() == "true"
+# 보관할 프로파일(.prof) 파일 수 (초과하면 오래된 파일부터 삭제)
+PROFILE_MAX_FILES = int(ENV.get("PROFILE_MAX_FILES", 100))
+
+
+# Documents
+# 앞단 프록시가 파일을 전송하도록 할 때 "x-accel-redirect" 또는 "x-sendfile"
+DOCUMENT_DOWNLOAD_BACKEND = ENV.get("DOCUMENT_DOWNLOAD_BACKEND", "django")
+DOCUMENT_DOWNLOAD_ACCEL_PREFIX = ENV.get(
+    "DOCUMENT_DOWNLOAD_ACCEL_PREFIX", "/protected-media/"
+)
+
+
 # Static files (CSS, JavaScript, Images)
 
 STATIC_URL = "static/"
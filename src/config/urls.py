@@ -1,3 +1,4 @@
+from config.views import DatabaseStatusView
 from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
@@ -16,6 +17,7 @@ urlpatterns = [
     path(f"{base_url}/users/", include("users.urls")),
     path(f"{base_url}/customers/", include("customers.urls")),
     path(f"{base_url}/counsels/", include("counsels.urls")),
+    path(f"{base_url}/health/db/", DatabaseStatusView.as_view(), name="health-db"),
     # path("", ReactAppView.as_view(), name="react-app"),
     path("", TemplateView.as_view(template_name="index.html")),  # React 빌드 파일 서빙
 ]
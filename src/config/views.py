@@ -1,4 +1,53 @@
+from django.db import connections
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
 # from django.views.generic import TemplateView
 #
 # class ReactAppView(TemplateView):
 #     template_name = "index.html"
+
+
+@extend_schema(tags=["Health"])
+class DatabaseStatusView(APIView):
+    """
+    현재 워커의 DB 커넥션 상태를 반환하는 모니터링 API
+    """
+
+    permission_classes = [IsAdminUser]
+    serializer_class = None
+
+    @extend_schema(
+        summary="DB 커넥션 상태 조회",
+        description="요청을 처리한 워커 프로세스의 DB 커넥션 설정과 연결 여부를 조회합니다. 관리자만 접근 가능합니다.",
+        responses={
+            200: {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "alias": {"type": "string", "example": "default"},
+                        "conn_max_age": {"type": "integer", "example": 60},
+                        "health_checks": {"type": "boolean", "example": True},
+                        "connected": {"type": "boolean", "example": True},
+                    },
+                },
+            },
+        },
+    )
+    def get(self, request):
+        results = []
+        for connection in connections.all(initialized_only=True):
+            settings_dict = connection.settings_dict
+            results.append(
+                {
+                    "alias": connection.alias,
+                    "conn_max_age": settings_dict.get("CONN_MAX_AGE"),
+                    "health_checks": settings_dict.get("CONN_HEALTH_CHECKS"),
+                    "connected": connection.connection is not None,
+                }
+            )
+        return Response(results, status=status.HTTP_200_OK)
@@ -0,0 +1,188 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+
+# 한 번에 읽어서 전송하는 크기
+BLOCK_SIZE = 64 * 1024
+# 단일 구간 Range 만 지원 (여러 구간 요청은 전체 파일로 응답)
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+class RangeFile:
+    """
+    파일의 현재 위치부터 length 바이트만 읽히도록 감싼 파일 객체
+    """
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    Range 헤더에서 (start, end) 를 구한다 (end 포함)
+
+    형식이 맞지 않으면 None (전체 파일로 응답), 파일 범위를 벗어나면 RangeNotSatisfiable
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    # bytes=-500 은 마지막 500 바이트
+    if not first:
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    if last and start > int(last):
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+
+def if_range_matches(request, etag, last_modified):
+    """
+    If-Range 가 없거나 현재 파일과 같을 때만 Range 요청을 처리
+    """
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    return if_range in (etag, http_date(last_modified))
+
+
+def file_response(request, stored_file, size, etag, last_modified):
+    """
+    Django 가 직접 파일을 전송하는 응답 (Range 요청이면 206)
+    """
+    try:
+        byte_range = None
+        if if_range_matches(request, etag, last_modified):
+            byte_range = parse_range(request.headers.get("Range"), size)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    file = stored_file.storage.open(stored_file.name, "rb")
+    if byte_range is None:
+        response = FileResponse(file)
+    else:
+        start, end = byte_range
+        file.seek(start)
+        response = FileResponse(RangeFile(file, end - start + 1), status=206)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = end - start + 1
+    response.block_size = BLOCK_SIZE
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def offload_response(stored_file):
+    """
+    전송을 앞단 프록시에 맡기는 응답 (본문 없이 내부 리다이렉트 헤더만 보냄)
+
+    nginx 는 DOCUMENT_DOWNLOAD_ACCEL_PREFIX 를 MEDIA_ROOT 에 연결한 internal location 이,
+    Apache 는 mod_xsendfile 이 Range 와 전송을 처리한다.
+    """
+    response = HttpResponse()
+    if settings.DOCUMENT_DOWNLOAD_BACKEND == "x-accel-redirect":
+        response["X-Accel-Redirect"] = quote(
+            f"{settings.DOCUMENT_DOWNLOAD_ACCEL_PREFIX}{stored_file.name}"
+        )
+    else:
+        response["X-Sendfile"] = stored_file.path
+    return response
+
+
+def stored_file_response(
+    request, stored_file, size, etag, last_modified, filename, as_attachment
+):
+    """
+    저장된 파일의 응답 (ETag / Last-Modified 가 맞으면 파일을 열지 않고 304)
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if settings.DOCUMENT_DOWNLOAD_BACKEND == "django":
+            response = file_response(request, stored_file, size, etag, last_modified)
+        else:
+            response = offload_response(stored_file)
+
+        content_type, _ = mimetypes.guess_type(filename)
+        response["Content-Type"] = content_type or "application/octet-stream"
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment, filename
+        )
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # 같은 URL 의 문서 파일이 교체될 수 있으므로 매번 ETag 로 재검증
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def document_response(request, document):
+    """
+    상담 문서 다운로드 응답
+
+    내용이 바뀌지 않는 blob 의 SHA-256 을 ETag 로 사용한다.
+    """
+    blob = document.blob
+    # 문서 파일이 더 예전에 저장된 blob 으로 교체될 수 있으므로 문서 수정 시각도 반영
+    last_modified = int(max(blob.created_at, document.updated_at).timestamp())
+    return stored_file_response(
+        request,
+        blob.file,
+        blob.size,
+        f'"{blob.sha256}"',
+        last_modified,
+        document.filename or blob.sha256,
+        as_attachment=True,
+    )
+
+
+def preview_response(request, document, kind):
+    """
+    상담 문서 미리보기 이미지 응답 (kind 는 thumbnail 또는 preview)
+
+    미리보기 파일 이름에 blob 의 SHA-256 과 크기가 들어가므로 파일 이름을 ETag 로 사용한다.
+    """
+    blob = document.blob
+    stored_file = getattr(blob, kind)
+    filename = os.path.basename(stored_file.name)
+    last_modified = int(max(blob.created_at, document.updated_at).timestamp())
+    return stored_file_response(
+        request,
+        stored_file,
+        stored_file.size,
+        f'"{filename}"',
+        last_modified,
+        filename,
+        as_attachment=False,
+    )
@@ -0,0 +1,119 @@
+import codecs
+import zipfile
+from xml.etree import ElementTree
+
+from pypdf import PdfReader
+from pypdf.errors import PyPdfError
+
+# 형식 판별에 사용하는 파일 앞부분 크기
+SNIFF_SIZE = 8 * 1024
+# 텍스트 파일을 한 번에 읽는 크기
+READ_SIZE = 64 * 1024
+# 텍스트 파일 인코딩 (앞에서부터 시도)
+TEXT_ENCODINGS = ("utf-8-sig", "cp949")
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class UnsupportedDocument(Exception):
+    """
+    본문을 읽을 수 없는 문서 (손상되었거나 암호화된 PDF 등)
+    """
+
+
+def extract_pdf(file, max_length):
+    pages = []
+    length = 0
+    try:
+        for page in PdfReader(file).pages:
+            text = page.extract_text() or ""
+            pages.append(text)
+            length += len(text) + 1
+            if length >= max_length:
+                break
+    except PyPdfError as error:
+        # 다시 시도해도 같은 결과이므로 재시도하지 않도록 구분
+        raise UnsupportedDocument(f"PDF 를 읽을 수 없습니다: {error}") from error
+    return "\n".join(pages)
+
+
+def extract_docx(file, max_length):
+    """
+    word/document.xml 의 문단을 순서대로 읽어 본문을 만든다
+    (docx 가 아닌 zip 파일이면 빈 문자열)
+    """
+    try:
+        archive = zipfile.ZipFile(file)
+    except zipfile.BadZipFile:
+        return ""
+
+    paragraphs = []
+    with archive:
+        try:
+            xml = archive.open("word/document.xml")
+        except KeyError:
+            return ""
+
+        runs = []
+        length = 0
+        with xml:
+            try:
+                # 압축을 풀면서 읽으므로 문서 전체를 메모리에 올리지 않는다
+                for _, element in ElementTree.iterparse(xml):
+                    if element.tag == f"{WORD_NAMESPACE}t":
+                        runs.append(element.text or "")
+                    elif element.tag == f"{WORD_NAMESPACE}tab":
+                        runs.append("\t")
+                    elif element.tag == f"{WORD_NAMESPACE}p":
+                        paragraph = "".join(runs)
+                        runs = []
+                        paragraphs.append(paragraph)
+                        length += len(paragraph) + 1
+                        element.clear()
+                        if length >= max_length:
+                            break
+            except ElementTree.ParseError:
+                pass
+    return "\n".join(paragraphs)
+
+
+def extract_plain_text(file, max_length, head):
+    """
+    TEXT_ENCODINGS 순서로 디코딩을 시도 (바이너리 파일이면 빈 문자열)
+    """
+    if b"\x00" in head:
+        return ""
+
+    for encoding in TEXT_ENCODINGS:
+        file.seek(0)
+        # 읽기 단위 경계에서 잘린 멀티바이트 문자도 이어서 디코딩
+        decoder = codecs.getincrementaldecoder(encoding)()
+        parts = []
+        length = 0
+        try:
+            while length < max_length and (data := file.read(READ_SIZE)):
+                text = decoder.decode(data)
+                parts.append(text)
+                length += len(text)
+        except UnicodeDecodeError:
+            continue
+        return "".join(parts)
+    return ""
+
+
+def extract_text(file, max_length):
+    """
+    파일 내용으로 형식을 판별해 본문을 최대 max_length 글자까지 추출
+
+    PDF 는 pypdf, docx 는 zipfile 로 읽고, 그 외에는 텍스트 파일로 디코딩한다.
+    본문이 없는 형식이면 빈 문자열, 읽을 수 없는 PDF 면 UnsupportedDocument.
+    """
+    head = file.read(SNIFF_SIZE)
+    file.seek(0)
+    if head.startswith(b"%PDF-"):
+        text = extract_pdf(file, max_length)
+    elif head.startswith(b"PK\x03\x04"):
+        text = extract_docx(file, max_length)
+    else:
+        text = extract_plain_text(file, max_length, head)
+    # PostgreSQL 의 text 컬럼은 NUL 문자를 저장할 수 없다
+    return text[:max_length].replace("\x00", "")
@@ -0,0 +1,130 @@
+from datetime import datetime, time, timedelta
+
+from common.constants.choices import STATUS_CHOICES
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+STATUS_VALUES = {value for value, _ in STATUS_CHOICES}
+BOOLEAN_VALUES = {"true": True, "1": True, "false": False, "0": False}
+# BigAutoField(bigint) 로 표현할 수 있는 가장 큰 id
+MAX_ID = 2**63 - 1
+
+
+class CounselFilterBackend(BaseFilterBackend):
+    """
+    상담 기록 목록 필터 (상태, 긴급 여부, 고객, 생성일 범위)
+
+    각 조건은 (customer, status, created_at), (customer, created_at) 및
+    긴급 상담 부분 인덱스로 처리된다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        errors = {}
+
+        if "status" in params:
+            statuses = [value for value in params["status"].split(",") if value]
+            invalid = [value for value in statuses if value not in STATUS_VALUES]
+            if invalid or not statuses:
+                errors["status"] = f"허용되는 값: {', '.join(sorted(STATUS_VALUES))}"
+            else:
+                queryset = queryset.filter(status__in=statuses)
+
+        if "emergency" in params:
+            emergency = BOOLEAN_VALUES.get(params["emergency"].lower())
+            if emergency is None:
+                errors["emergency"] = "true 또는 false 를 입력하세요."
+            else:
+                queryset = queryset.filter(emergency=emergency)
+
+        if "customer" in params:
+            try:
+                customer_id = int(params["customer"])
+            except ValueError:
+                customer_id = None
+            # bigint 범위를 벗어나면 DB 에서 오류가 나므로 미리 거른다
+            if customer_id is None or not 0 < customer_id <= MAX_ID:
+                errors["customer"] = "고객 ID 는 숫자여야 합니다."
+            else:
+                queryset = queryset.filter(customer_id=customer_id)
+
+        for param, lookup in (
+            ("created_after", "created_at__gte"),
+            ("created_before", "created_at__lt"),
+        ):
+            if param not in params:
+                continue
+            value = self.parse_datetime_param(
+                params[param], end=param == "created_before"
+            )
+            if value is None:
+                errors[param] = "ISO 8601 날짜 또는 일시를 입력하세요."
+            else:
+                queryset = queryset.filter(**{lookup: value})
+
+        if errors:
+            raise ValidationError(errors)
+        return queryset
+
+    def parse_datetime_param(self, value, end=False):
+        """
+        날짜만 입력된 경우 created_after 는 그날 0시, created_before 는 다음날 0시로 해석
+        """
+        try:
+            # parse_datetime 은 날짜만 있어도 0시로 해석하므로 날짜인지 먼저 확인
+            parsed_date = parse_date(value)
+            if parsed_date is not None:
+                if end:
+                    parsed_date += timedelta(days=1)
+                parsed = datetime.combine(parsed_date, time.min)
+            else:
+                parsed = parse_datetime(value)
+                if parsed is None:
+                    return None
+        except ValueError:
+            return None
+
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": "status",
+                "required": False,
+                "in": "query",
+                "description": "상담 상태 (쉼표로 여러 값 지정 가능)",
+                "schema": {"type": "string", "example": "Pending,In Progress"},
+            },
+            {
+                "name": "emergency",
+                "required": False,
+                "in": "query",
+                "description": "긴급 상담 여부",
+                "schema": {"type": "boolean"},
+            },
+            {
+                "name": "customer",
+                "required": False,
+                "in": "query",
+                "description": "고객 ID",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": "created_after",
+                "required": False,
+                "in": "query",
+                "description": "이 일시 이후에 생성된 상담 기록 (포함)",
+                "schema": {"type": "string", "format": "date-time"},
+            },
+            {
+                "name": "created_before",
+                "required": False,
+                "in": "query",
+                "description": "이 일시 이전에 생성된 상담 기록 (날짜만 입력하면 해당일 포함)",
+                "schema": {"type": "string", "format": "date-time"},
+            },
+        ]
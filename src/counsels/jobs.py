@@ -0,0 +1,122 @@
+from collections import Counter
+from pathlib import PurePosixPath
+
+from common.jobs import enqueue, job
+from common.logging_config import get_logger
+from counsels.extraction import UnsupportedDocument, extract_text
+from counsels.models import (Counsel, CounselDocument, DocumentBlob,
+                             DocumentText)
+from counsels.previews import preview_name, preview_sizes, render_previews
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+# 공통 로거 가져오기
+logger = get_logger()
+
+
+@job(max_attempts=5)
+def delete_blob_file(name):
+    """
+    참조하는 문서가 없어 삭제된 blob 의 파일 삭제
+    """
+    default_storage.delete(name)
+
+
+@job()
+def extract_document_text(blob_id):
+    """
+    상담 문서 파일의 본문을 추출해 검색 색인에 저장
+
+    본문은 내용(blob) 단위로 저장되므로 이미 추출한 blob 은 건너뛴다.
+    """
+    blob = DocumentBlob.objects.filter(pk=blob_id, text__isnull=True).first()
+    if blob is None:
+        return
+
+    try:
+        with blob.file.storage.open(blob.file.name, "rb") as file:
+            content = extract_text(file, settings.DOCUMENT_TEXT_MAX_LENGTH)
+    except UnsupportedDocument as error:
+        logger.info("상담 문서 본문 추출 건너뜀", blob_id=blob_id, reason=str(error))
+        return
+
+    DocumentText.objects.update_or_create(blob=blob, defaults={"content": content})
+    logger.info("상담 문서 본문 추출", blob_id=blob_id, length=len(content))
+
+
+@job()
+def generate_document_previews(blob_id):
+    """
+    이미지 상담 문서의 미리보기를 만들어 원본 옆에 저장
+
+    이미 같은 내용, 같은 크기로 만든 미리보기가 있으면 건너뛰고,
+    크기 설정이 바뀌어 다시 만든 경우 이전 파일은 삭제한다.
+    """
+    blob = DocumentBlob.objects.filter(pk=blob_id).first()
+    if blob is None:
+        return
+    sizes = {
+        kind: size
+        for kind, size in preview_sizes().items()
+        if PurePosixPath(getattr(blob, kind).name or "").name
+        != preview_name(blob, kind, size)
+    }
+    if not sizes:
+        return
+
+    with blob.file.storage.open(blob.file.name, "rb") as file:
+        previews = render_previews(file, sizes)
+    if not previews:
+        return
+
+    old_names = [getattr(blob, kind).name for kind in previews if getattr(blob, kind)]
+    for kind, content in previews.items():
+        getattr(blob, kind).save(
+            preview_name(blob, kind, sizes[kind]), content, save=False
+        )
+    new_names = [getattr(blob, kind).name for kind in previews]
+
+    with transaction.atomic():
+        updated = DocumentBlob.objects.filter(pk=blob_id).update(
+            **{kind: getattr(blob, kind).name for kind in previews}
+        )
+        # 그 사이 blob 이 삭제되었으면 방금 만든 파일을, 아니면 이전 파일을 삭제
+        for name in old_names if updated else new_names:
+            enqueue(delete_blob_file, name=name)
+    logger.info("상담 문서 미리보기 생성", blob_id=blob_id, kinds=list(previews))
+
+
+def delete_documents(queryset, batch_size):
+    """
+    상담 문서를 batch_size 개씩 삭제
+
+    문서마다 signal 로 blob 참조 수를 줄이는 대신 배치마다 blob 별로 한 번에 줄인다.
+    참조가 없어진 blob 의 파일은 delete_blob_file 작업으로 삭제된다.
+    """
+    while True:
+        with transaction.atomic():
+            # 같은 삭제 작업이 동시에 실행되어도 참조 수를 두 번 줄이지 않도록 잠근다
+            batch = list(
+                queryset.select_for_update().values_list("id", "blob_id")[:batch_size]
+            )
+            if not batch:
+                return
+            ids = [document_id for document_id, _ in batch]
+            blob_counts = Counter(blob_id for _, blob_id in batch if blob_id)
+            # blob 을 비워 두면 post_delete signal 에서는 참조 수를 줄이지 않는다
+            CounselDocument.objects.filter(id__in=ids).update(blob=None)
+            CounselDocument.objects.filter(id__in=ids).delete()
+            for blob_id, count in blob_counts.items():
+                DocumentBlob.objects.release(blob_id, count)
+
+
+def delete_counsels(queryset, batch_size):
+    """
+    상담 기록을 상담 문서부터 batch_size 개씩 삭제
+
+    한 번에 모든 행을 메모리에 올리거나 하나의 긴 트랜잭션으로 지우지 않는다.
+    """
+    while ids := list(queryset.values_list("id", flat=True)[:batch_size]):
+        delete_documents(CounselDocument.objects.filter(counsel_id__in=ids), batch_size)
+        Counsel.objects.filter(id__in=ids).delete()
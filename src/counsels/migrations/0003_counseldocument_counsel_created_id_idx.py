@@ -0,0 +1,47 @@
+# Generated by Django 5.1.15 on 2026-10-17 05:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0002_initial"),
+        ("customers", "0003_remove_customer_key_customersecurity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CounselDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("summary", models.TextField()),
+                ("document", models.FileField(upload_to="documents/%Y/%m/%d")),
+                ("path", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="counsel",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="counsel_created_id_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="counseldocument",
+            name="counsel",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to="counsels.counsel"
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0003_counseldocument_counsel_created_id_idx"),
+        ("customers", "0004_customer_user_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="counsel",
+            index=models.Index(
+                fields=["customer", "-created_at"], name="counsel_customer_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="counsel",
+            index=models.Index(
+                condition=models.Q(("emergency", True)),
+                fields=["customer", "-created_at"],
+                name="counsel_emergency_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="counsel",
+            name="customer",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="customers.customer",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0004_counsel_customer_indexes"),
+        ("customers", "0004_customer_user_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="counsel",
+            index=models.Index(
+                fields=["customer", "status", "-created_at"],
+                name="counsel_customer_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from common.search import build_search_document
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def fill_search_document(apps, schema_editor):
+    """
+    기존 상담 기록의 검색 색인 컬럼을 배치 단위로 채운다
+    """
+    Counsel = apps.get_model("counsels", "Counsel")
+    last_id = 0
+    while True:
+        counsels = list(
+            Counsel.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", "summary", "details")[:BATCH_SIZE]
+        )
+        if not counsels:
+            break
+        for counsel in counsels:
+            counsel.search_document = build_search_document(
+                counsel.summary, counsel.details
+            )
+        Counsel.objects.bulk_update(counsels, ["search_document"])
+        last_id = counsels[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0005_counsel_customer_status_idx"),
+        ("customers", "0005_customer_search_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="counsel",
+            name="search_document",
+            field=models.TextField(default="", editable=False),
+        ),
+        # 인덱스 생성 전에 값을 채워 인덱스를 한 번만 빌드
+        migrations.RunPython(fill_search_document, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="counsel",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "search_document", config="simple"
+                ),
+                name="counsel_search_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:19
+
+import hashlib
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+CHUNK_SIZE = 1024 * 1024
+
+
+def fill_size_sha256(apps, schema_editor):
+    """
+    기존 상담 문서의 크기와 SHA-256 을 파일을 청크 단위로 읽어 채운다
+    저장소에 파일이 없는 문서는 건너뛴다.
+    """
+    CounselDocument = apps.get_model("counsels", "CounselDocument")
+    last_id = 0
+    while True:
+        documents = list(
+            CounselDocument.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", "document")[:BATCH_SIZE]
+        )
+        if not documents:
+            break
+        for document in documents:
+            hasher = hashlib.sha256()
+            size = 0
+            try:
+                with document.document.open("rb") as file:
+                    for chunk in file.chunks(CHUNK_SIZE):
+                        hasher.update(chunk)
+                        size += len(chunk)
+            except (FileNotFoundError, ValueError):
+                continue
+            document.size = size
+            document.sha256 = hasher.hexdigest()
+        CounselDocument.objects.bulk_update(documents, ["size", "sha256"])
+        last_id = documents[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0006_counsel_search_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="counseldocument",
+            name="sha256",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="counseldocument",
+            name="size",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_size_sha256, migrations.RunPython.noop),
+    ]
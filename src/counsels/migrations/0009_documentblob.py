@@ -0,0 +1,123 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:26
+
+import os
+
+import counsels.models
+import django.db.models.deletion
+from django.core.files.storage import default_storage
+from django.db import migrations, models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 500
+
+
+def move_documents_to_blobs(apps, schema_editor):
+    """
+    기존 상담 문서 파일을 SHA-256 기준 blob 으로 옮긴다
+
+    내용이 같은 파일은 blob 하나로 합치고, 원래 파일은 커밋 후에 삭제한다.
+    파일이 없어 SHA-256 을 계산하지 못한 문서는 blob 없이 둔다.
+    """
+    CounselDocument = apps.get_model("counsels", "CounselDocument")
+    DocumentBlob = apps.get_model("counsels", "DocumentBlob")
+    old_names = set()
+    last_id = 0
+    while True:
+        documents = list(
+            CounselDocument.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", "document", "sha256", "size")[:BATCH_SIZE]
+        )
+        if not documents:
+            break
+        blobs = {
+            blob.sha256: blob
+            for blob in DocumentBlob.objects.filter(
+                sha256__in={document.sha256 for document in documents}
+            )
+        }
+        for document in documents:
+            document.filename = os.path.basename(document.document.name)[:255]
+            if not document.sha256:
+                continue
+            blob = blobs.get(document.sha256)
+            if blob is None:
+                blob = DocumentBlob(sha256=document.sha256, size=document.size)
+                name = counsels.models.blob_upload_to(blob, document.document.name)
+                if not default_storage.exists(name):
+                    try:
+                        with default_storage.open(document.document.name, "rb") as file:
+                            name = default_storage.save(name, file)
+                    except FileNotFoundError:
+                        continue
+                blob.file = name
+                blob.save()
+                blobs[blob.sha256] = blob
+            document.blob = blob
+            old_names.add(document.document.name)
+        CounselDocument.objects.bulk_update(documents, ["blob", "filename"])
+        last_id = documents[-1].id
+
+    DocumentBlob.objects.update(
+        ref_count=Coalesce(
+            Subquery(
+                CounselDocument.objects.filter(blob=OuterRef("pk"))
+                .values("blob")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            0,
+        )
+    )
+    # 롤백되면 원래 파일이 필요하므로 커밋된 뒤에 삭제
+    transaction.on_commit(lambda: [default_storage.delete(name) for name in old_names])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0008_documentuploadsession"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sha256", models.CharField(max_length=64, unique=True)),
+                ("size", models.BigIntegerField()),
+                (
+                    "file",
+                    models.FileField(upload_to=counsels.models.blob_upload_to),
+                ),
+                ("ref_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="counseldocument",
+            name="filename",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="counseldocument",
+            name="blob",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="documents",
+                to="counsels.documentblob",
+            ),
+        ),
+        migrations.RunPython(move_documents_to_blobs, migrations.RunPython.noop),
+    ]
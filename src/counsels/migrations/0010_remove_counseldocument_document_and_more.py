@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:26
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    0009 에서 blob 으로 옮긴 뒤 더 이상 쓰지 않는 컬럼 삭제
+    (데이터 변경과 ALTER TABLE 을 한 트랜잭션에서 하지 않도록 분리)
+    """
+
+    dependencies = [
+        ("counsels", "0009_documentblob"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="counseldocument",
+            name="document",
+        ),
+        migrations.RemoveField(
+            model_name="counseldocument",
+            name="path",
+        ),
+        migrations.RemoveField(
+            model_name="counseldocument",
+            name="sha256",
+        ),
+        migrations.RemoveField(
+            model_name="counseldocument",
+            name="size",
+        ),
+        migrations.RemoveField(
+            model_name="documentuploadsession",
+            name="path",
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:37
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0010_remove_counseldocument_document_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentText",
+            fields=[
+                (
+                    "blob",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="text",
+                        serialize=False,
+                        to="counsels.documentblob",
+                    ),
+                ),
+                ("content", models.TextField(blank=True, default="")),
+                ("search_document", models.TextField(default="", editable=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        django.contrib.postgres.search.SearchVector(
+                            "search_document", config="simple"
+                        ),
+                        name="document_text_search_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:40
+
+import counsels.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0011_documenttext"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="documentblob",
+            name="preview",
+            field=models.FileField(
+                blank=True, editable=False, upload_to=counsels.models.preview_upload_to
+            ),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="thumbnail",
+            field=models.FileField(
+                blank=True, editable=False, upload_to=counsels.models.preview_upload_to
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("counsels", "0012_documentblob_previews"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="documentuploadsession",
+            name="deduplicated",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
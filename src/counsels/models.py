@@ -1,23 +1,242 @@
+import uuid
+
 from common.constants.choices import STATUS_CHOICES
+from common.jobs import enqueue
+from common.search import build_search_document, search_vector
 from customers.models import Customer
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.db import IntegrityError, models, transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from users.models import User
 
 
 class Counsel(models.Model):
-    customer = models.ForeignKey(Customer, on_delete=models.CASCADE)
+    # 단일 컬럼 인덱스 대신 (customer, created_at) 복합 인덱스를 사용
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE, db_index=False)
     summary = models.TextField()
     details = models.TextField()
     emergency = models.BooleanField(default=False)
     status = models.CharField(choices=STATUS_CHOICES, default="Pending")
+    # 전문 검색용 2-gram 토큰 (save 시 summary, details 로부터 계산)
+    search_document = models.TextField(default="", editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(fields=["-created_at", "-id"], name="counsel_created_id_idx"),
+            # 고객별 상담 기록 최신순 조회용
+            models.Index(
+                fields=["customer", "-created_at"], name="counsel_customer_created_idx"
+            ),
+            # 고객별 상태 필터 + 최신순 조회용
+            models.Index(
+                fields=["customer", "status", "-created_at"],
+                name="counsel_customer_status_idx",
+            ),
+            # 긴급 상담만 모아보는 부분 인덱스
+            models.Index(
+                fields=["customer", "-created_at"],
+                name="counsel_emergency_idx",
+                condition=models.Q(emergency=True),
+            ),
+            # summary, details 전문 검색용
+            GinIndex(search_vector("search_document"), name="counsel_search_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        검색 색인 컬럼을 함께 갱신
+        """
+        self.search_document = build_search_document(self.summary, self.details)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"summary", "details"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "search_document"}
+        super().save(*args, **kwargs)
+
+
+def blob_upload_to(instance, filename):
+    """
+    SHA-256 으로 정해지는 저장 경로 (blobs/ab/cd/abcd...)
+    한 디렉토리에 파일이 몰리지 않도록 앞 4자리로 두 단계 나눈다.
+    """
+    sha256 = instance.sha256
+    return f"blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def preview_upload_to(instance, filename):
+    """
+    미리보기는 원본 blob 과 같은 디렉토리에 저장 (blobs/ab/cd/abcd....thumbnail-200.jpg)
+    """
+    sha256 = instance.sha256
+    return f"blobs/{sha256[:2]}/{sha256[2:4]}/{filename}"
+
+
+class DocumentBlobManager(models.Manager):
+    def acquire(self, sha256):
+        """
+        같은 내용의 blob 이 있으면 참조 수를 1 늘려서 반환 (없으면 None)
+        """
+        with transaction.atomic():
+            blob = self.select_for_update().filter(sha256=sha256).first()
+            if blob is None:
+                return None
+            blob.ref_count += 1
+            blob.save(update_fields=["ref_count"])
+            return blob
+
+    def store(self, file, sha256, size):
+        """
+        내용이 같은 blob 이 있으면 참조만 늘리고, 없을 때만 파일을 저장
+
+        중복 업로드는 저장소에 아무것도 쓰지 않는다.
+        """
+        while True:
+            blob = self.acquire(sha256)
+            if blob is not None:
+                return blob
+
+            blob = self.model(sha256=sha256, size=size, ref_count=1)
+            blob.file.save(sha256, file, save=False)
+            try:
+                with transaction.atomic():
+                    blob.save(force_insert=True)
+                    # 본문 추출과 미리보기 생성은 새로 저장된 내용에 대해서만 한 번 실행
+                    enqueue("counsels.jobs.extract_document_text", blob_id=blob.id)
+                    enqueue("counsels.jobs.generate_document_previews", blob_id=blob.id)
+                return blob
+            except IntegrityError:
+                # 같은 내용이 동시에 저장되었으면 먼저 저장된 blob 을 참조
+                blob.file.delete(save=False)
+
+    def release(self, blob_id, count=1):
+        """
+        참조 수를 count 만큼 줄이고, 더 이상 참조하는 문서가 없으면 blob 과 파일을 삭제
+
+        파일 삭제는 같은 트랜잭션에서 작업 큐에 넣어, 롤백되면 파일이 남고
+        요청 처리 중에는 저장소에 접근하지 않는다.
+        같은 내용이 그 사이 다시 저장되더라도 저장소가 다른 이름을 주므로 지워지지 않는다.
+        """
+        with transaction.atomic():
+            blob = self.select_for_update().filter(pk=blob_id).first()
+            if blob is None:
+                return
+            if blob.ref_count > count:
+                blob.ref_count -= count
+                blob.save(update_fields=["ref_count"])
+                return
+            try:
+                # 참조 수가 어긋나 있어도 문서가 남아 있으면 PROTECT 로 삭제되지 않는다
+                with transaction.atomic():
+                    blob.delete()
+            except models.ProtectedError:
+                return
+            for stored_file in (blob.file, blob.thumbnail, blob.preview):
+                if stored_file:
+                    enqueue("counsels.jobs.delete_blob_file", name=stored_file.name)
+
+
+class DocumentBlob(models.Model):
+    """
+    내용(SHA-256) 기준으로 한 번만 저장되는 상담 문서 파일
+
+    같은 파일을 여러 상담 기록에 올려도 blob 하나를 참조 수(ref_count)로 공유한다.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    size = models.BigIntegerField()
+    file = models.FileField(upload_to=blob_upload_to)
+    ref_count = models.PositiveIntegerField(default=0)
+    # 이미지 파일의 고정 크기 미리보기 (작업 큐에서 생성, 이미지가 아니면 비어 있음)
+    thumbnail = models.FileField(
+        upload_to=preview_upload_to, blank=True, editable=False
+    )
+    preview = models.FileField(upload_to=preview_upload_to, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = DocumentBlobManager()
+
+
+class DocumentText(models.Model):
+    """
+    상담 문서 파일에서 추출한 본문
+
+    blob(내용) 단위로 한 번만 추출하므로, 같은 파일을 다시 올리거나 여러 문서가 공유해도
+    다시 추출하지 않는다.
+    """
+
+    blob = models.OneToOneField(
+        DocumentBlob, on_delete=models.CASCADE, primary_key=True, related_name="text"
+    )
+    content = models.TextField(blank=True, default="")
+    # 전문 검색용 2-gram 토큰 (save 시 content 로부터 계산)
+    search_document = models.TextField(default="", editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(search_vector("search_document"), name="document_text_search_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        검색 색인 컬럼을 함께 갱신
+        """
+        self.search_document = build_search_document(self.content)
+        super().save(*args, **kwargs)
+
 
 class CounselDocument(models.Model):
     counsel = models.ForeignKey(Counsel, on_delete=models.CASCADE)
     summary = models.TextField()
-    document = models.FileField(upload_to="documents/%Y/%m/%d")
-    path = models.TextField()
+    # 파일 내용은 blob 이 가지고, 문서는 업로드한 파일 이름만 가진다
+    blob = models.ForeignKey(
+        DocumentBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        editable=False,
+        related_name="documents",
+    )
+    filename = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def document(self):
+        """
+        저장된 파일 (같은 내용의 문서들이 공유)
+        """
+        return self.blob.file if self.blob_id else None
+
+
+@receiver(post_delete, sender=CounselDocument)
+def release_document_blob(sender, instance, **kwargs):
+    """
+    상담 기록 삭제에 따른 연쇄 삭제에서도 blob 참조 수가 맞도록 signal 로 처리
+    """
+    if instance.blob_id:
+        DocumentBlob.objects.release(instance.blob_id)
+
+
+class DocumentUploadSession(models.Model):
+    """
+    이어 올리기(청크) 업로드 세션
+
+    청크는 DOCUMENT_UPLOAD_TEMP_DIR/<id>/ 에 offset 순서대로 저장되고,
+    offset 은 지금까지 저장이 끝난 바이트 수이다.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    counsel = models.ForeignKey(Counsel, on_delete=models.CASCADE)
+    summary = models.TextField()
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0)
+    # 클라이언트가 알려준 SHA-256 (있으면 완료 시 검증)
+    sha256 = models.CharField(max_length=64, blank=True, default="")
+    # 생성 시 같은 내용을 이미 올린 적이 있어 청크 없이 완료하는 세션
+    deduplicated = models.BooleanField(default=False, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,62 @@
+import io
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+# DocumentBlob 의 미리보기 필드 이름
+PREVIEW_KINDS = ("thumbnail", "preview")
+PREVIEW_FORMAT = "JPEG"
+PREVIEW_QUALITY = 80
+
+
+def preview_sizes():
+    """
+    미리보기 종류별 긴 변 길이 (DocumentBlob 의 필드 이름 -> 픽셀)
+    """
+    return {
+        "thumbnail": settings.DOCUMENT_THUMBNAIL_SIZE,
+        "preview": settings.DOCUMENT_PREVIEW_SIZE,
+    }
+
+
+def preview_name(blob, kind, size):
+    # 내용(SHA-256)과 크기가 이름에 들어가므로 둘 중 하나가 바뀌면 새 파일이 된다
+    return f"{blob.sha256}.{kind}-{size}.jpg"
+
+
+def to_rgb(image):
+    """
+    JPEG 으로 저장할 수 있도록 투명한 부분은 흰 배경으로 채워 RGB 로 변환
+    """
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def render_previews(file, sizes):
+    """
+    이미지 파일을 sizes({종류: 긴 변 길이}) 에 맞춰 줄인 JPEG 들을 만든다
+
+    한 번 디코딩한 이미지를 큰 크기부터 차례로 줄이고,
+    JPEG 은 디코딩 단계에서 필요한 크기 근처로 줄여 읽는다.
+    이미지가 아니면 빈 dict.
+    """
+    largest = max(sizes.values())
+    try:
+        image = Image.open(file)
+        image.draft("RGB", (largest, largest))
+        image = to_rgb(ImageOps.exif_transpose(image))
+    except (OSError, Image.DecompressionBombError):
+        return {}
+
+    previews = {}
+    for kind, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        image.thumbnail((size, size), reducing_gap=3.0)
+        buffer = io.BytesIO()
+        image.save(buffer, PREVIEW_FORMAT, quality=PREVIEW_QUALITY, optimize=True)
+        previews[kind] = ContentFile(buffer.getvalue())
+    return previews
@@ -1,8 +1,13 @@
-from counsels.models import Counsel, CounselDocument
+import re
+
+from common.serializers import TimedSerializerMixin
+from counsels.models import Counsel, CounselDocument, DocumentUploadSession
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 
 
-class CounselSerializer(serializers.ModelSerializer):
+class CounselSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Counsel
         fields = [
@@ -16,7 +21,19 @@ class CounselSerializer(serializers.ModelSerializer):
         read_only_fields = ("id",)
 
 
-class CounselDocumentSerializer(serializers.ModelSerializer):
+class CounselDocumentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    # 파일은 DocumentBlob 에 저장되므로 뷰에서 validated_data 의 document 를 꺼내 처리
+    # 저장 위치(MEDIA_URL)는 공개하지 않고, 소유자를 확인하는 다운로드 주소로만 제공
+    document = serializers.FileField(write_only=True)
+    download_url = serializers.SerializerMethodField()
+    size = serializers.IntegerField(source="blob.size", read_only=True, allow_null=True)
+    sha256 = serializers.CharField(
+        source="blob.sha256", read_only=True, allow_null=True
+    )
+    # 이미지 문서의 미리보기 주소 (이미지가 아니거나 아직 생성되지 않았으면 null)
+    thumbnail_url = serializers.SerializerMethodField()
+    preview_url = serializers.SerializerMethodField()
+
     class Meta:
         model = CounselDocument
         fields = [
@@ -24,8 +41,85 @@ class CounselDocumentSerializer(serializers.ModelSerializer):
             "counsel",
             "summary",
             "document",
-            "path",
+            "download_url",
+            "filename",
+            "size",
+            "sha256",
+            "thumbnail_url",
+            "preview_url",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ("id",)
+        # 상담은 URL 로 지정하고, 파일 이름과 크기, 체크섬은 업로드한 파일에서 가져온다
+        read_only_fields = ("id", "counsel", "filename")
+
+    @extend_schema_field(serializers.URLField(allow_null=True))
+    def get_download_url(self, document):
+        if document.blob_id is None:
+            return None
+        return reverse(
+            "counsels:counsel_document_download",
+            kwargs={"counsel_pk": document.counsel_id, "pk": document.id},
+            request=self.context.get("request"),
+        )
+
+    def build_preview_url(self, document, kind):
+        if document.blob_id is None or not getattr(document.blob, kind):
+            return None
+        return reverse(
+            "counsels:counsel_document_preview",
+            kwargs={"counsel_pk": document.counsel_id, "pk": document.id, "kind": kind},
+            request=self.context.get("request"),
+        )
+
+    @extend_schema_field(serializers.URLField(allow_null=True))
+    def get_thumbnail_url(self, document):
+        return self.build_preview_url(document, "thumbnail")
+
+    @extend_schema_field(serializers.URLField(allow_null=True))
+    def get_preview_url(self, document):
+        return self.build_preview_url(document, "preview")
+
+
+class CounselDocumentSearchSerializer(CounselDocumentSerializer):
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta(CounselDocumentSerializer.Meta):
+        fields = CounselDocumentSerializer.Meta.fields + ["rank"]
+
+
+class DocumentUploadSessionSerializer(
+    TimedSerializerMixin, serializers.ModelSerializer
+):
+    class Meta:
+        model = DocumentUploadSession
+        fields = [
+            "id",
+            "counsel",
+            "summary",
+            "filename",
+            "size",
+            "offset",
+            "sha256",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = ("id", "counsel", "offset")
+
+    def validate_size(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("파일 크기는 0보다 커야 합니다.")
+        return value
+
+    def validate_sha256(self, value):
+        value = value.lower()
+        if value and not re.fullmatch(r"[0-9a-f]{64}", value):
+            raise serializers.ValidationError("SHA-256 은 64자리 16진수여야 합니다.")
+        return value
+
+
+class CounselSearchSerializer(CounselSerializer):
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta(CounselSerializer.Meta):
+        fields = CounselSerializer.Meta.fields + ["created_at", "rank"]
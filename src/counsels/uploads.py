@@ -0,0 +1,298 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from common.exceptions import (BadRequestException, ConflictException,
+                               NotFoundException, PayloadTooLargeException)
+from counsels.models import (CounselDocument, DocumentBlob,
+                             DocumentUploadSession)
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import transaction
+from django.db.models import Sum
+
+# 요청 본문과 청크 파일을 한 번에 읽는 크기
+READ_SIZE = 1024 * 1024
+
+
+def get_used_storage(user_id):
+    """
+    사용자가 업로드한 상담 문서의 총 용량 (바이트)
+    """
+    total = CounselDocument.objects.filter(
+        counsel__customer__user_id=user_id
+    ).aggregate(total=Sum("blob__size"))["total"]
+    return total or 0
+
+
+def get_sha256(file):
+    """
+    업로드 핸들러가 계산한 SHA-256 (없으면 파일을 읽어서 계산)
+    """
+    sha256 = getattr(file, "sha256", None)
+    if sha256:
+        return sha256
+    hasher = hashlib.sha256()
+    for chunk in file.chunks(READ_SIZE):
+        hasher.update(chunk)
+    file.seek(0)
+    return hasher.hexdigest()
+
+
+def find_owned_blob(user_id, sha256, size):
+    """
+    사용자가 이미 올린 문서 중 내용이 같은 blob (없으면 None)
+
+    다른 사용자의 파일까지 찾으면 해시만 알아도 남의 파일을 얻을 수 있으므로
+    자신의 문서가 참조하는 blob 만 찾는다.
+    """
+    if not sha256:
+        return None
+    return (
+        DocumentBlob.objects.filter(
+            sha256=sha256,
+            size=size,
+            documents__counsel__customer__user_id=user_id,
+        )
+        .only("id")
+        .first()
+    )
+
+
+class ChecksumUploadHandler(TemporaryFileUploadHandler):
+    """
+    업로드를 청크 단위로 임시 파일에 쓰면서 SHA-256 과 크기를 계산하는 업로드 핸들러
+
+    메모리에 파일 전체를 올리지 않고, 저장 시에는 임시 파일을 이동(rename)하므로
+    파일 내용은 디스크에 한 번만 쓰인다.
+    파일당 최대 크기나 남은 용량을 넘으면 전송 도중 413 으로 중단한다.
+    """
+
+    def __init__(self, request=None, max_size=None, remaining_quota=None):
+        super().__init__(request)
+        self.max_size = max_size
+        self.remaining_quota = remaining_quota
+        self.total_received = 0
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hasher = hashlib.sha256()
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        self.total_received += len(raw_data)
+        if self.max_size is not None and self.received > self.max_size:
+            raise PayloadTooLargeException(
+                detail=f"파일 크기는 {self.max_size} 바이트를 넘을 수 없습니다."
+            )
+        if self.remaining_quota is not None and (
+            self.total_received > self.remaining_quota
+        ):
+            raise PayloadTooLargeException(
+                detail="사용 가능한 저장 용량을 초과했습니다."
+            )
+
+        self.hasher.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.sha256 = self.hasher.hexdigest()
+        return file
+
+
+class ChecksumUploadMixin:
+    """
+    요청 본문을 파싱하기 전에 ChecksumUploadHandler 를 설치하는 뷰 믹스인
+
+    인증 이후에 설치해야 사용자별 남은 용량을 계산할 수 있다.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method not in ("POST", "PUT", "PATCH"):
+            return
+
+        remaining_quota = settings.DOCUMENT_USER_QUOTA - get_used_storage(
+            request.user.id
+        )
+        request.upload_handlers = [
+            ChecksumUploadHandler(
+                request,
+                max_size=settings.DOCUMENT_MAX_UPLOAD_SIZE,
+                remaining_quota=max(remaining_quota, 0),
+            )
+        ]
+
+
+class AssembledFile(File):
+    """
+    청크를 이어 붙여 만든 임시 파일
+
+    temporary_file_path 를 제공하므로 저장소에는 복사 없이 이동(rename)된다.
+    """
+
+    def __init__(self, path, name, size, sha256):
+        super().__init__(None, name)
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+
+    def temporary_file_path(self):
+        return str(self.path)
+
+
+def upload_dir(session):
+    return Path(settings.DOCUMENT_UPLOAD_TEMP_DIR) / str(session.id)
+
+
+def chunk_path(session, offset):
+    # 파일 이름을 offset 으로 정해 같은 위치의 청크는 덮어쓰도록 한다
+    return upload_dir(session) / f"{offset:020d}.chunk"
+
+
+def discard_upload(session):
+    """
+    업로드 세션의 청크 디렉토리 삭제
+    """
+    shutil.rmtree(upload_dir(session), ignore_errors=True)
+
+
+def check_quota(user_id, size):
+    """
+    size 바이트를 더 저장하면 사용자별 용량을 넘는지 확인
+    """
+    if get_used_storage(user_id) + size > settings.DOCUMENT_USER_QUOTA:
+        raise PayloadTooLargeException(detail="사용 가능한 저장 용량을 초과했습니다.")
+
+
+def receive_chunk(session, offset, stream, length):
+    """
+    요청 본문을 offset 위치의 청크로 저장하고 갱신된 세션을 반환
+
+    본문은 임시 파일에 나누어 쓰고, 전부 받은 뒤 세션 offset 이 그대로일 때만
+    청크로 확정한다. 전송이 끊기면 임시 파일만 지워지므로 같은 offset 부터 다시 보내면 된다.
+    """
+    directory = upload_dir(session)
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            remaining = length
+            while remaining:
+                data = stream.read(min(READ_SIZE, remaining))
+                if not data:
+                    raise BadRequestException(
+                        detail="청크 전송이 중단되었습니다. 현재 offset 부터 다시 보내주세요."
+                    )
+                file.write(data)
+                remaining -= len(data)
+
+        # 동시에 같은 offset 으로 보낸 요청은 하나만 확정
+        with transaction.atomic():
+            locked = (
+                DocumentUploadSession.objects.select_for_update()
+                .filter(pk=session.pk)
+                .first()
+            )
+            if locked is None:
+                raise NotFoundException(detail="업로드 세션을 찾을 수 없습니다.")
+            if locked.offset != offset:
+                raise ConflictException(
+                    detail=f"Upload-Offset 이 현재 offset({locked.offset}) 과 다릅니다."
+                )
+            os.replace(temp_path, chunk_path(session, offset))
+            locked.offset = offset + length
+            locked.save(update_fields=["offset", "updated_at"])
+        return locked
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def assemble_chunks(session):
+    """
+    청크를 offset 순서대로 이어 붙이면서 SHA-256 을 계산
+
+    READ_SIZE 씩 스트리밍하므로 파일 전체를 메모리에 올리지 않는다.
+    """
+    # 청크를 하나도 받지 않은 세션은 디렉토리가 없으므로 먼저 만든다
+    directory = upload_dir(session)
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, assembled_path = tempfile.mkstemp(dir=directory, suffix=".assembled")
+    hasher = hashlib.sha256()
+    offset = 0
+    try:
+        with os.fdopen(fd, "wb") as target:
+            while offset < session.size:
+                with open(chunk_path(session, offset), "rb") as chunk:
+                    while data := chunk.read(READ_SIZE):
+                        hasher.update(data)
+                        target.write(data)
+                        offset += len(data)
+    except FileNotFoundError:
+        os.remove(assembled_path)
+        raise ConflictException(
+            detail="업로드된 청크를 찾을 수 없습니다. 처음부터 다시 업로드하세요."
+        )
+    return AssembledFile(
+        assembled_path, os.path.basename(session.filename), offset, hasher.hexdigest()
+    )
+
+
+def finalize_upload(session, user_id):
+    """
+    모든 청크를 받은 세션을 상담 문서로 만들고 세션과 청크를 정리
+
+    생성 시 이미 올린 적 있는 파일로 확인된 세션만 청크 없이 기존 blob 을 참조하고,
+    청크를 받은 세션은 항상 청크를 합쳐 계산한 SHA-256 으로 blob 을 찾는다.
+    """
+    if session.offset != session.size:
+        raise ConflictException(
+            detail=f"아직 받지 못한 데이터가 있습니다. (offset {session.offset} / {session.size})"
+        )
+    check_quota(user_id, session.size)
+
+    file = None
+    if not session.deduplicated:
+        file = assemble_chunks(session)
+    try:
+        if file is not None and session.sha256 and session.sha256 != file.sha256:
+            DocumentUploadSession.objects.filter(pk=session.pk).delete()
+            discard_upload(session)
+            raise BadRequestException(
+                detail="업로드된 파일의 SHA-256 이 일치하지 않습니다. 처음부터 다시 업로드하세요."
+            )
+
+        with transaction.atomic():
+            # 동시에 완료 요청이 오면 세션을 먼저 지운 요청만 문서를 만든다
+            deleted, _ = DocumentUploadSession.objects.filter(pk=session.pk).delete()
+            if not deleted:
+                raise ConflictException(detail="이미 완료되었거나 취소된 업로드입니다.")
+            if file is None:
+                # 세션 생성 후 사용자의 문서가 모두 삭제되었으면 청크부터 다시 올려야 한다
+                blob = None
+                if find_owned_blob(user_id, session.sha256, session.size):
+                    blob = DocumentBlob.objects.acquire(session.sha256)
+                if blob is None:
+                    raise ConflictException(
+                        detail="업로드된 청크를 찾을 수 없습니다. 처음부터 다시 업로드하세요."
+                    )
+            else:
+                blob = DocumentBlob.objects.store(file, file.sha256, file.size)
+            document = CounselDocument.objects.create(
+                counsel_id=session.counsel_id,
+                summary=session.summary,
+                filename=os.path.basename(session.filename),
+                blob=blob,
+            )
+    finally:
+        if file is not None and os.path.exists(file.path):
+            os.remove(file.path)
+
+    discard_upload(session)
+    return document
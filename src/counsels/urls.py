@@ -1,12 +1,21 @@
 from counsels.models import CounselDocument
 from counsels.views import (CounselDetailView, CounselDocumentDetailView,
+                            CounselDocumentDownloadView,
                             CounselDocumentListCreateView,
-                            CounselListCreateView)
+                            CounselDocumentPreviewView,
+                            CounselDocumentSearchView, CounselListCreateView,
+                            CounselSearchView, DocumentUploadSessionCreateView,
+                            DocumentUploadSessionDetailView,
+                            DocumentUploadSessionFinalizeView)
 from django.urls import path
 
 app_name = "counsels"
 urlpatterns = [
     path("", CounselListCreateView.as_view(), name="list"),
+    path("search/", CounselSearchView.as_view(), name="search"),
+    path(
+        "documents/search/", CounselDocumentSearchView.as_view(), name="document_search"
+    ),
     path("<int:pk>/", CounselDetailView.as_view(), name="detail"),
     path(
         "<int:pk>/documents/",
@@ -14,8 +23,33 @@ urlpatterns = [
         name="counsel_documents",
     ),
     path(
-        "<int:customer_pk>/documents/<int:pk>/",
+        "<int:pk>/documents/uploads/",
+        DocumentUploadSessionCreateView.as_view(),
+        name="document_uploads",
+    ),
+    path(
+        "<int:pk>/documents/uploads/<uuid:upload_id>/",
+        DocumentUploadSessionDetailView.as_view(),
+        name="document_upload_detail",
+    ),
+    path(
+        "<int:pk>/documents/uploads/<uuid:upload_id>/finalize/",
+        DocumentUploadSessionFinalizeView.as_view(),
+        name="document_upload_finalize",
+    ),
+    path(
+        "<int:counsel_pk>/documents/<int:pk>/",
         CounselDocumentDetailView.as_view(),
         name="counsel_document_detail",
     ),
+    path(
+        "<int:counsel_pk>/documents/<int:pk>/download/",
+        CounselDocumentDownloadView.as_view(),
+        name="counsel_document_download",
+    ),
+    path(
+        "<int:counsel_pk>/documents/<int:pk>/previews/<str:kind>/",
+        CounselDocumentPreviewView.as_view(),
+        name="counsel_document_preview",
+    ),
 ]
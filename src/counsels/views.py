@@ -1,16 +1,56 @@
-import logging
-
-from common.exceptions import NotFoundException, UnauthorizedException
-from counsels.models import Counsel
-from counsels.serializers import CounselDocumentSerializer, CounselSerializer
-from drf_spectacular.utils import extend_schema
+from common.exceptions import (BadRequestException, ConflictException,
+                               NotFoundException, PayloadTooLargeException,
+                               UnauthorizedException)
+from common.logging_config import get_logger
+from common.pagination import (CreatedAtCursorPagination,
+                               PageNumberWithoutCountPagination)
+from common.search import MIN_QUERY_LENGTH, build_search_query, search_vector
+from counsels.downloads import document_response, preview_response
+from counsels.filters import CounselFilterBackend
+from counsels.models import (Counsel, CounselDocument, DocumentBlob,
+                             DocumentUploadSession)
+from counsels.previews import PREVIEW_KINDS
+from counsels.serializers import (CounselDocumentSearchSerializer,
+                                  CounselDocumentSerializer,
+                                  CounselSearchSerializer, CounselSerializer,
+                                  DocumentUploadSessionSerializer)
+from counsels.uploads import (ChecksumUploadMixin, check_quota, discard_upload,
+                              finalize_upload, find_owned_blob, get_sha256,
+                              receive_chunk)
+from django.conf import settings
+from django.contrib.postgres.search import SearchRank
+from django.db import transaction
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
 from rest_framework.exceptions import NotAuthenticated, ValidationError
-from rest_framework.generics import (ListCreateAPIView,
+from rest_framework.generics import (CreateAPIView, GenericAPIView,
+                                     ListAPIView, ListCreateAPIView,
+                                     RetrieveDestroyAPIView,
                                      RetrieveUpdateDestroyAPIView)
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
 # 공통 로거 가져오기
-logger = logging.getLogger("custom_api_logger")
+logger = get_logger()
+
+
+def get_search_query(request):
+    """
+    q 파라미터로 SearchQuery 를 만든다 (검색어가 없거나 짧으면 400)
+    """
+    text = request.query_params.get("q", "").strip()
+    if not text:
+        raise ValidationError({"q": "검색어를 입력하세요."})
+    if len(text) < MIN_QUERY_LENGTH:
+        raise ValidationError(
+            {"q": f"검색어는 {MIN_QUERY_LENGTH}글자 이상 입력하세요."}
+        )
+
+    query = build_search_query(text)
+    if query is None:
+        raise ValidationError({"q": "검색할 수 있는 단어가 없습니다."})
+    return query
 
 
 @extend_schema(tags=["Counsel"])
@@ -21,11 +61,15 @@ class CounselListCreateView(ListCreateAPIView):
 
     serializer_class = CounselSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    filter_backends = [CounselFilterBackend]
 
     @extend_schema(
         tags=["Counsel"],
         summary="상담 기록 목록 조회",
-        description="현재 로그인된 사용자가 소유한 고객의 상담 기록을 조회합니다.",
+        description="현재 로그인된 사용자가 소유한 고객의 상담 기록을 최신순으로 조회합니다. "
+        "응답의 next/previous 커서로 다음 페이지를 조회합니다. "
+        "status, emergency, customer, created_after, created_before 로 필터링할 수 있습니다.",
         responses={
             200: CounselSerializer(many=True),
             401: {
@@ -84,24 +128,157 @@ class CounselListCreateView(ListCreateAPIView):
         if not user.is_authenticated:
             raise NotAuthenticated("로그인이 필요합니다.")
 
-        logger.debug(f"상담 기록 조회 요청: 사용자 ID {user.id}")
-        return Counsel.objects.filter(customer__user=user)
+        logger.debug("상담 기록 조회 요청", user_id=user.id)
+        return Counsel.objects.filter(
+            customer__user_id=user.id, customer__deleted_at__isnull=True
+        ).defer("search_document")
 
     def perform_create(self, serializer):
         """
         상담 기록 생성 시, 고객과 연결된 유저를 검증
         """
         customer = serializer.validated_data.get("customer")
-        if customer.user != self.request.user:
+        if customer.user_id != self.request.user.id:
             logger.warning(
-                f"권한 없는 고객 상담 기록 생성 시도: 사용자 ID {self.request.user.id}, 고객 ID {customer.id}"
+                "권한 없는 고객 상담 기록 생성 시도",
+                user_id=self.request.user.id,
+                customer_id=customer.id,
             )
             raise UnauthorizedException(
                 detail="이 고객에 대한 권한이 없습니다.", request=self.request
             )
         serializer.save()
         logger.info(
-            f"상담 기록 생성 성공: 사용자 ID {self.request.user.id}, 고객 ID {customer.id}"
+            "상담 기록 생성 성공", user_id=self.request.user.id, customer_id=customer.id
+        )
+
+
+@extend_schema(tags=["Counsel"])
+class CounselSearchView(ListAPIView):
+    """
+    상담 기록 전문 검색 API (요약, 상세 내용)
+    """
+
+    serializer_class = CounselSearchSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = PageNumberWithoutCountPagination
+
+    @extend_schema(
+        tags=["Counsel"],
+        summary="상담 기록 검색",
+        description="현재 로그인된 사용자가 소유한 고객의 상담 기록을 요약과 상세 내용으로 검색합니다. "
+        "검색어의 모든 단어를 포함하는 상담 기록을 관련도순으로 조회하며, "
+        f"검색어는 {MIN_QUERY_LENGTH}글자 이상이어야 합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=str,
+                required=True,
+                description="검색어",
+            ),
+        ],
+        responses={
+            200: CounselSearchSerializer(many=True),
+            400: {
+                "type": "object",
+                "properties": {
+                    "q": {"type": "string", "example": "검색어를 입력하세요."},
+                },
+            },
+            401: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "Authentication credentials were not provided.",
+                    },
+                },
+            },
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        query = get_search_query(self.request)
+        logger.debug("상담 기록 검색 요청", user_id=self.request.user.id)
+        # GIN 인덱스와 같은 tsvector 식으로 필터링해야 인덱스를 사용
+        vector = search_vector("search_document")
+        return (
+            Counsel.objects.filter(
+                customer__user_id=self.request.user.id,
+                customer__deleted_at__isnull=True,
+            )
+            .alias(search=vector)
+            .annotate(rank=SearchRank(vector, query))
+            .filter(search=query)
+            .defer("search_document")
+            .order_by("-rank", "-id")
+        )
+
+
+@extend_schema(tags=["Counsel"])
+class CounselDocumentSearchView(ListAPIView):
+    """
+    상담 문서 본문 검색 API (업로드한 파일에서 추출한 본문)
+    """
+
+    serializer_class = CounselDocumentSearchSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = PageNumberWithoutCountPagination
+
+    @extend_schema(
+        tags=["Counsel"],
+        summary="상담 문서 본문 검색",
+        description="현재 로그인된 사용자가 소유한 고객의 상담 문서를 파일 본문으로 검색합니다. "
+        "본문은 업로드 후 백그라운드에서 추출되므로 방금 올린 문서는 바로 검색되지 않을 수 있습니다. "
+        "검색어의 모든 단어를 포함하는 문서를 관련도순으로 조회하며, "
+        f"검색어는 {MIN_QUERY_LENGTH}글자 이상이어야 합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=str,
+                required=True,
+                description="검색어",
+            ),
+        ],
+        responses={
+            200: CounselDocumentSearchSerializer(many=True),
+            400: {
+                "type": "object",
+                "properties": {
+                    "q": {"type": "string", "example": "검색어를 입력하세요."},
+                },
+            },
+            401: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "Authentication credentials were not provided.",
+                    },
+                },
+            },
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        query = get_search_query(self.request)
+        logger.debug("상담 문서 검색 요청", user_id=self.request.user.id)
+        # GIN 인덱스와 같은 tsvector 식으로 필터링해야 인덱스를 사용
+        vector = search_vector("blob__text__search_document")
+        return (
+            CounselDocument.objects.filter(
+                counsel__customer__user_id=self.request.user.id,
+                counsel__customer__deleted_at__isnull=True,
+            )
+            .select_related("blob")
+            .alias(search=vector)
+            .annotate(rank=SearchRank(vector, query))
+            .filter(search=query)
+            .order_by("-rank", "-id")
         )
 
 
@@ -271,8 +448,10 @@ class CounselDetailView(RetrieveUpdateDestroyAPIView):
         if not user.is_authenticated:
             raise NotAuthenticated("로그인이 필요합니다.")
 
-        logger.debug(f"상담 기록 상세 조회 요청: 사용자 ID {user.id}")
-        return Counsel.objects.filter(customer__user=user)
+        logger.debug("상담 기록 상세 조회 요청", user_id=user.id)
+        return Counsel.objects.filter(
+            customer__user_id=user.id, customer__deleted_at__isnull=True
+        )
 
     def handle_exception(self, exc):
         """
@@ -280,7 +459,9 @@ class CounselDetailView(RetrieveUpdateDestroyAPIView):
         """
         if isinstance(exc, Counsel.DoesNotExist):
             logger.warning(
-                f"상담 기록 조회 실패: 상담 기록 ID {self.kwargs.get('pk')}, 사용자 ID {self.request.user.id}"
+                "상담 기록 조회 실패",
+                counsel_id=self.kwargs.get("pk"),
+                user_id=self.request.user.id,
             )
             raise NotFoundException(
                 detail="요청한 상담 기록을 찾을 수 없습니다.", request=self.request
@@ -288,43 +469,123 @@ class CounselDetailView(RetrieveUpdateDestroyAPIView):
         return super().handle_exception(exc)
 
 
+class OwnedCounselMixin:
+    """
+    URL 의 상담 기록(pk)이 로그인한 사용자 소유인지 확인하여 self.counsel 로 두는 뷰 믹스인
+
+    initial 에서 확인하므로 업로드 본문을 받기 전에 404 로 끝낼 수 있다.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.counsel = self.get_counsel()
+
+    def get_counsel(self):
+        try:
+            return Counsel.objects.only("id").get(
+                pk=self.kwargs["pk"],
+                customer__user_id=self.request.user.id,
+                customer__deleted_at__isnull=True,
+            )
+        except Counsel.DoesNotExist:
+            logger.warning(
+                "상담 문서 접근 실패: 상담 기록 없음 또는 권한 없음",
+                user_id=self.request.user.id,
+                counsel_id=self.kwargs["pk"],
+            )
+            raise NotFoundException(detail="요청한 상담 기록을 찾을 수 없습니다.")
+
+
 @extend_schema(tags=["Counsel-Document"])
-class CounselDocumentListCreateView(ListCreateAPIView):
+class CounselDocumentListCreateView(
+    OwnedCounselMixin, ChecksumUploadMixin, ListCreateAPIView
+):
+    """
+    상담 문서 목록 조회 및 업로드 API
+    """
+
     serializer_class = CounselDocumentSerializer
     permission_classes = [IsAuthenticated]
-    queryset = Counsel.objects.all()
+    pagination_class = CreatedAtCursorPagination
+
+    @extend_schema(
+        summary="상담 문서 목록 조회",
+        description="로그인한 사용자가 소유한 상담 기록의 문서를 최신순으로 조회합니다.",
+        responses={
+            200: CounselDocumentSerializer(many=True),
+            404: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "요청한 상담 기록을 찾을 수 없습니다.",
+                    },
+                },
+            },
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="상담 문서 업로드",
+        description="상담 기록에 문서를 업로드합니다. 업로드 중 파일 크기와 SHA-256 을 계산하여 "
+        "같은 내용의 파일이 이미 저장되어 있으면 새로 저장하지 않고 공유하며, "
+        "파일당 최대 크기나 사용자별 저장 용량을 넘으면 413 으로 중단됩니다.",
+        request=CounselDocumentSerializer,
+        responses={
+            201: CounselDocumentSerializer,
+            404: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "요청한 상담 기록을 찾을 수 없습니다.",
+                    },
+                },
+            },
+            413: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "사용 가능한 저장 용량을 초과했습니다.",
+                    },
+                },
+            },
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        return super().post(request, *args, **kwargs)
+
+    def get_queryset(self):
+        return CounselDocument.objects.filter(
+            counsel_id=self.counsel.id
+        ).select_related("blob")
 
     def perform_create(self, serializer):
         """
-        새 상담 문서를 생성하고 기존 상담과 연결
+        업로드한 파일을 내용(SHA-256) 기준 blob 으로 저장
+        이미 같은 내용의 blob 이 있으면 파일을 저장하지 않고 참조만 늘린다.
         """
-        try:
-            counsel = serializer.validated_data.get("counsel")
-
-            # 상담이 로그인된 사용자와 연결된 고객의 상담인지 확인
-            if counsel.customer.user != self.request.user:
-                logger.warning(
-                    f"권한 없는 상담 문서 생성 시도: 사용자 ID {self.request.user.id}, 상담 ID {counsel.id}"
-                )
-                raise ValidationError("이 상담에 대한 권한이 없습니다.")
-
-            # 상담 문서 생성
-            serializer.save()
-            logger.info(
-                f"상담 문서 생성 성공: 사용자 ID {self.request.user.id}, 상담 ID {counsel.id}, 문서 ID {serializer.instance.id}"
+        document = serializer.validated_data.pop("document")
+        with transaction.atomic():
+            blob = DocumentBlob.objects.store(
+                document, get_sha256(document), document.size
             )
-
-        except KeyError as e:
-            logger.error("상담 문서 생성 중 필수 필드 누락")
-            raise ValidationError(f"필수 데이터가 누락되었습니다: {e}")
-        except Exception as e:
-            logger.exception("상담 문서 생성 중 오류 발생")
-            raise ValidationError("상담 문서 생성 중 문제가 발생했습니다.")
-        serializer.save()
+            serializer.save(counsel=self.counsel, blob=blob, filename=document.name)
+        logger.info(
+            "상담 문서 생성 성공",
+            user_id=self.request.user.id,
+            counsel_id=self.counsel.id,
+            document_id=serializer.instance.id,
+            blob_id=blob.id,
+            size=document.size,
+        )
 
 
 @extend_schema(tags=["Counsel-Document"])
-class CounselDocumentDetailView(RetrieveUpdateDestroyAPIView):
+class CounselDocumentDetailView(ChecksumUploadMixin, RetrieveUpdateDestroyAPIView):
     """
     특정 상담 문서를 조회, 수정, 삭제하는 API
     """
@@ -332,6 +593,30 @@ class CounselDocumentDetailView(RetrieveUpdateDestroyAPIView):
     serializer_class = CounselDocumentSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        return CounselDocument.objects.filter(
+            counsel_id=self.kwargs["counsel_pk"],
+            counsel__customer__user_id=self.request.user.id,
+            counsel__customer__deleted_at__isnull=True,
+        ).select_related("blob")
+
+    def perform_update(self, serializer):
+        """
+        파일을 교체한 경우 새 blob 을 참조하고 이전 blob 의 참조를 해제
+        """
+        document = serializer.validated_data.pop("document", None)
+        if document is None:
+            serializer.save()
+            return
+        with transaction.atomic():
+            old_blob_id = serializer.instance.blob_id
+            blob = DocumentBlob.objects.store(
+                document, get_sha256(document), document.size
+            )
+            serializer.save(blob=blob, filename=document.name)
+            if old_blob_id:
+                DocumentBlob.objects.release(old_blob_id)
+
     @extend_schema(
         summary="상담 문서 조회",
         description="로그인한 사용자가 소유한 특정 상담 문서를 조회합니다.",
@@ -437,3 +722,344 @@ class CounselDocumentDetailView(RetrieveUpdateDestroyAPIView):
         특정 상담 문서를 삭제합니다.
         """
         return super().delete(request, *args, **kwargs)
+
+
+@extend_schema(tags=["Counsel-Document"])
+class CounselDocumentDownloadView(GenericAPIView):
+    """
+    상담 문서 파일 다운로드 API
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="상담 문서 다운로드",
+        description="로그인한 사용자가 소유한 상담 문서의 파일을 내려받습니다. "
+        "Range 헤더로 일부만 받을 수 있고(206), ETag(SHA-256) 나 Last-Modified 로 "
+        "조건부 요청을 보내면 바뀌지 않은 파일은 304 로 응답합니다. "
+        "프록시 전송이 설정된 경우 파일 전송은 nginx/Apache 가 처리합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="Range",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                required=False,
+                description="받을 바이트 구간 (예: bytes=0-1023)",
+            ),
+        ],
+        responses={
+            (200, "application/octet-stream"): OpenApiTypes.BINARY,
+            (206, "application/octet-stream"): OpenApiTypes.BINARY,
+            304: None,
+            404: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "요청한 문서를 찾을 수 없습니다.",
+                    },
+                },
+            },
+            416: None,
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        document = self.get_object()
+        if document.blob is None:
+            raise NotFoundException(detail="문서 파일을 찾을 수 없습니다.")
+        logger.debug(
+            "상담 문서 다운로드 요청",
+            user_id=request.user.id,
+            document_id=document.id,
+            range=request.headers.get("Range"),
+        )
+        return document_response(request, document)
+
+    def get_queryset(self):
+        # URL 의 상담 기록이 로그인한 사용자의 고객 것인지 함께 확인
+        return CounselDocument.objects.filter(
+            counsel_id=self.kwargs["counsel_pk"],
+            counsel__customer__user_id=self.request.user.id,
+            counsel__customer__deleted_at__isnull=True,
+        ).select_related("blob")
+
+
+@extend_schema(tags=["Counsel-Document"])
+class CounselDocumentPreviewView(CounselDocumentDownloadView):
+    """
+    상담 문서 미리보기 이미지 API
+    """
+
+    @extend_schema(
+        summary="상담 문서 미리보기",
+        description="이미지 상담 문서를 고정 크기로 줄인 JPEG 을 내려받습니다. "
+        "kind 는 thumbnail 또는 preview 이며, 주소는 상담 문서 조회 응답의 "
+        "thumbnail_url, preview_url 로 제공됩니다. 미리보기는 업로드 후 백그라운드에서 "
+        "생성되므로 이미지가 아니거나 아직 생성되지 않았으면 404 로 응답합니다.",
+        responses={
+            (200, "image/jpeg"): OpenApiTypes.BINARY,
+            304: None,
+            404: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "미리보기를 찾을 수 없습니다.",
+                    },
+                },
+            },
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        kind = kwargs["kind"]
+        if kind not in PREVIEW_KINDS:
+            raise NotFoundException(detail="미리보기를 찾을 수 없습니다.")
+        document = self.get_object()
+        if document.blob is None or not getattr(document.blob, kind):
+            raise NotFoundException(detail="미리보기를 찾을 수 없습니다.")
+        return preview_response(request, document, kind)
+
+
+@extend_schema(tags=["Counsel-Document"])
+class DocumentUploadSessionCreateView(OwnedCounselMixin, CreateAPIView):
+    """
+    상담 문서 이어 올리기(청크 업로드) 세션 생성 API
+    """
+
+    serializer_class = DocumentUploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="청크 업로드 시작",
+        description="파일 이름, 전체 크기, 요약으로 업로드 세션을 만듭니다. "
+        "이후 세션에 청크를 offset 순서대로 올리고, 모두 올리면 완료 요청으로 문서를 생성합니다. "
+        "sha256 을 함께 보내면 완료 시 파일 무결성을 검증하고, "
+        "이미 올린 적 있는 파일이면 offset 이 size 로 응답되어 청크 없이 바로 완료할 수 있습니다.",
+        request=DocumentUploadSessionSerializer,
+        responses={
+            201: DocumentUploadSessionSerializer,
+            404: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "요청한 상담 기록을 찾을 수 없습니다.",
+                    },
+                },
+            },
+            413: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "사용 가능한 저장 용량을 초과했습니다.",
+                    },
+                },
+            },
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        return super().post(request, *args, **kwargs)
+
+    def perform_create(self, serializer):
+        size = serializer.validated_data["size"]
+        if size > settings.DOCUMENT_MAX_UPLOAD_SIZE:
+            raise PayloadTooLargeException(
+                detail=f"파일 크기는 {settings.DOCUMENT_MAX_UPLOAD_SIZE} 바이트를 넘을 수 없습니다."
+            )
+        check_quota(self.request.user.id, size)
+        # 이미 올린 적 있는 파일이면 청크 없이 바로 완료할 수 있도록 offset 을 끝으로 둔다
+        blob = find_owned_blob(
+            self.request.user.id, serializer.validated_data.get("sha256"), size
+        )
+        serializer.save(
+            counsel=self.counsel,
+            offset=size if blob else 0,
+            deduplicated=blob is not None,
+        )
+        logger.info(
+            "청크 업로드 시작",
+            user_id=self.request.user.id,
+            counsel_id=self.counsel.id,
+            upload_id=serializer.instance.id,
+            size=size,
+        )
+
+
+class DocumentUploadSessionMixin:
+    """
+    로그인한 사용자가 URL 의 상담 기록(pk)에서 시작한 업로드 세션만 조회
+    """
+
+    serializer_class = DocumentUploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_url_kwarg = "upload_id"
+
+    def get_queryset(self):
+        return DocumentUploadSession.objects.filter(
+            counsel_id=self.kwargs["pk"],
+            counsel__customer__user_id=self.request.user.id,
+            counsel__customer__deleted_at__isnull=True,
+        )
+
+
+@extend_schema(tags=["Counsel-Document"])
+class DocumentUploadSessionDetailView(
+    DocumentUploadSessionMixin, RetrieveDestroyAPIView
+):
+    """
+    업로드 세션 상태 조회, 청크 업로드, 취소 API
+    """
+
+    @extend_schema(
+        summary="청크 업로드 상태 조회",
+        description="지금까지 저장된 바이트 수(offset)를 조회합니다. "
+        "연결이 끊긴 경우 이 offset 부터 다시 업로드합니다.",
+        responses={200: DocumentUploadSessionSerializer},
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="청크 업로드",
+        description="요청 본문 전체를 Upload-Offset 위치의 청크로 저장합니다. "
+        "Upload-Offset 은 현재 세션의 offset 과 같아야 하며, "
+        f"청크 하나는 최대 {settings.DOCUMENT_UPLOAD_MAX_CHUNK_SIZE} 바이트까지 보낼 수 있습니다.",
+        parameters=[
+            OpenApiParameter(
+                name="Upload-Offset",
+                type=int,
+                location=OpenApiParameter.HEADER,
+                required=True,
+                description="청크의 시작 위치 (바이트)",
+            ),
+        ],
+        request={"application/offset+octet-stream": OpenApiTypes.BINARY},
+        responses={
+            200: DocumentUploadSessionSerializer,
+            409: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "Upload-Offset 이 현재 offset(0) 과 다릅니다.",
+                    },
+                },
+            },
+            413: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "청크 크기는 10485760 바이트를 넘을 수 없습니다.",
+                    },
+                },
+            },
+        },
+    )
+    def patch(self, request, *args, **kwargs):
+        session = self.get_object()
+        offset = self.get_header_int(request, "Upload-Offset")
+        length = self.get_header_int(request, "Content-Length")
+        if length <= 0:
+            raise BadRequestException(detail="빈 청크는 업로드할 수 없습니다.")
+        if length > settings.DOCUMENT_UPLOAD_MAX_CHUNK_SIZE:
+            raise PayloadTooLargeException(
+                detail=f"청크 크기는 {settings.DOCUMENT_UPLOAD_MAX_CHUNK_SIZE} 바이트를 넘을 수 없습니다."
+            )
+        # 본문을 받기 전에 offset 을 먼저 확인
+        if offset != session.offset:
+            raise ConflictException(
+                detail=f"Upload-Offset 이 현재 offset({session.offset}) 과 다릅니다."
+            )
+        if offset + length > session.size:
+            raise BadRequestException(detail="청크가 파일 크기를 넘습니다.")
+
+        session = receive_chunk(session, offset, request.stream, length)
+        logger.debug(
+            "청크 저장",
+            user_id=request.user.id,
+            upload_id=session.id,
+            offset=session.offset,
+            size=session.size,
+        )
+        return Response(
+            self.get_serializer(session).data,
+            headers={"Upload-Offset": str(session.offset)},
+        )
+
+    @extend_schema(
+        summary="청크 업로드 취소",
+        description="업로드 세션과 지금까지 저장된 청크를 삭제합니다.",
+        responses={204: None},
+    )
+    def delete(self, request, *args, **kwargs):
+        return super().delete(request, *args, **kwargs)
+
+    def get_header_int(self, request, name):
+        try:
+            return int(request.headers.get(name, ""))
+        except ValueError:
+            raise BadRequestException(detail=f"{name} 헤더가 올바르지 않습니다.")
+
+    def perform_destroy(self, instance):
+        upload_id = instance.id
+        # delete() 후에는 id 가 None 이 되므로 청크를 먼저 삭제
+        discard_upload(instance)
+        instance.delete()
+        logger.info(
+            "청크 업로드 취소", user_id=self.request.user.id, upload_id=upload_id
+        )
+
+
+@extend_schema(tags=["Counsel-Document"])
+class DocumentUploadSessionFinalizeView(DocumentUploadSessionMixin, GenericAPIView):
+    """
+    청크 업로드 완료 API
+    """
+
+    @extend_schema(
+        summary="청크 업로드 완료",
+        description="저장된 청크를 순서대로 이어 붙여 상담 문서를 생성합니다. "
+        "청크를 스트리밍으로 합치며 크기와 SHA-256 을 계산하고, 업로드 세션은 삭제됩니다. "
+        "같은 내용의 파일이 이미 저장되어 있으면 새로 저장하지 않고 공유합니다.",
+        request=None,
+        responses={
+            201: CounselDocumentSerializer,
+            400: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "업로드된 파일의 SHA-256 이 일치하지 않습니다. 처음부터 다시 업로드하세요.",
+                    },
+                },
+            },
+            409: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "아직 받지 못한 데이터가 있습니다. (offset 0 / 1024)",
+                    },
+                },
+            },
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        session = self.get_object()
+        document = finalize_upload(session, request.user.id)
+        logger.info(
+            "상담 문서 생성 성공",
+            user_id=request.user.id,
+            counsel_id=document.counsel_id,
+            document_id=document.id,
+            upload_id=session.id,
+            blob_id=document.blob_id,
+        )
+        return Response(
+            CounselDocumentSerializer(
+                document, context=self.get_serializer_context()
+            ).data,
+            status=status.HTTP_201_CREATED,
+        )
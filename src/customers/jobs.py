@@ -0,0 +1,33 @@
+from common.jobs import job
+from common.logging_config import get_logger
+from counsels.jobs import delete_counsels
+from counsels.models import Counsel
+from customers.models import Customer
+from django.conf import settings
+
+# 공통 로거 가져오기
+logger = get_logger()
+
+
+def delete_customers(queryset, batch_size):
+    """
+    고객을 상담 기록부터 batch_size 명씩 삭제 (보안 정보는 고객과 함께 삭제)
+    """
+    deleted = 0
+    while ids := list(queryset.values_list("id", flat=True)[:batch_size]):
+        delete_counsels(Counsel.objects.filter(customer_id__in=ids), batch_size)
+        Customer.all_objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+    return deleted
+
+
+@job(max_attempts=5)
+def purge_customer(customer_id):
+    """
+    삭제 표시된 고객과 상담 기록, 상담 문서 삭제
+    """
+    deleted = delete_customers(
+        Customer.all_objects.filter(pk=customer_id, deleted_at__isnull=False),
+        settings.PURGE_BATCH_SIZE,
+    )
+    logger.info("고객 삭제 완료", customer_id=customer_id, deleted=deleted)
@@ -0,0 +1,81 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:04
+
+from common.hangul import normalize_phone_number, phone_suffix, to_choseong
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def fill_search_fields(apps, schema_editor):
+    """
+    기존 고객의 검색용 파생 컬럼을 배치 단위로 채운다
+    """
+    Customer = apps.get_model("customers", "Customer")
+    last_id = 0
+    while True:
+        customers = list(
+            Customer.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", "name", "phone_number")[:BATCH_SIZE]
+        )
+        if not customers:
+            break
+        for customer in customers:
+            customer.name_choseong = to_choseong(customer.name)
+            customer.phone_digits = normalize_phone_number(customer.phone_number)
+            customer.phone_suffix = phone_suffix(customer.phone_number)
+        Customer.objects.bulk_update(
+            customers, ["name_choseong", "phone_digits", "phone_suffix"]
+        )
+        last_id = customers[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customers", "0004_customer_user_created_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="name_choseong",
+            field=models.CharField(default="", editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="customer",
+            name="phone_digits",
+            field=models.CharField(default="", editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="customer",
+            name="phone_suffix",
+            field=models.CharField(default="", editable=False, max_length=4),
+        ),
+        # 인덱스 생성 전에 값을 채워 인덱스를 한 번만 빌드
+        migrations.RunPython(fill_search_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(
+                fields=["user", "name_choseong"],
+                name="customer_user_choseong_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(
+                fields=["user", "phone_digits"],
+                name="customer_user_phone_idx",
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(
+                fields=["user", "phone_suffix"], name="customer_user_phone_suffix_idx"
+            ),
+        ),
+    ]
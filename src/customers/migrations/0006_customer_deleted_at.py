@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("customers", "0005_customer_search_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
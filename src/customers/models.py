@@ -1,21 +1,84 @@
 from common.constants.choices import GENDER_CHOICES
+from common.hangul import normalize_phone_number, phone_suffix, to_choseong
 from django.db import models
 from users.models import User
 
 
+class CustomerManager(models.Manager):
+    """
+    삭제 표시된 고객은 제외하는 기본 매니저
+    (삭제 작업에서 삭제 중인 고객까지 다룰 때는 all_objects 사용)
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class Customer(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # 단일 컬럼 인덱스 대신 (user, created_at, id) 복합 인덱스를 사용
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     name = models.CharField(max_length=100)
     gender = models.CharField(max_length=10, choices=GENDER_CHOICES)  # 성별 선택지 제공
     phone_number = models.CharField(max_length=100)
     address = models.CharField(max_length=100, null=True, blank=True)
+    # 검색용 파생 컬럼 (save 시 name, phone_number 로부터 계산)
+    name_choseong = models.CharField(max_length=100, default="", editable=False)
+    phone_digits = models.CharField(max_length=100, default="", editable=False)
+    phone_suffix = models.CharField(max_length=4, default="", editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 삭제 요청 시각 (설정되면 조회되지 않고, 상담 기록과 함께 백그라운드에서 삭제됨)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = CustomerManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        indexes = [
+            # 사용자별 고객 목록 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="customer_user_created_idx"
+            ),
+            # 초성 / 전화번호 접두어 검색 (LIKE 'ㄱㅁ%') 용
+            models.Index(
+                fields=["user", "name_choseong"],
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+                name="customer_user_choseong_idx",
+            ),
+            models.Index(
+                fields=["user", "phone_digits"],
+                opclasses=["int8_ops", "varchar_pattern_ops"],
+                name="customer_user_phone_idx",
+            ),
+            # 전화번호 뒤 4자리 검색용
+            models.Index(
+                fields=["user", "phone_suffix"], name="customer_user_phone_suffix_idx"
+            ),
+        ]
+
+    def fill_search_fields(self):
+        """
+        이름 초성, 숫자만 남긴 전화번호, 전화번호 뒤 4자리를 계산
+        """
+        self.name_choseong = to_choseong(self.name)
+        self.phone_digits = normalize_phone_number(self.phone_number)
+        self.phone_suffix = phone_suffix(self.phone_number)
 
     def save(self, *args, **kwargs):
         """
         Customer가 생성될 때 CustomerSecurity도 자동 생성
+        검색용 파생 컬럼도 함께 갱신
         """
+        self.fill_search_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"name", "phone_number"} & set(update_fields):
+            kwargs["update_fields"] = {
+                *update_fields,
+                "name_choseong",
+                "phone_digits",
+                "phone_suffix",
+            }
+
         is_new = self.pk is None
         super().save(*args, **kwargs)  # Customer 저장
         if is_new:  # 새로 생성된 경우만 CustomerSecurity 생성
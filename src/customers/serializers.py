@@ -1,9 +1,11 @@
+from common.serializers import TimedSerializerMixin
+from counsels.serializers import CounselDocumentSerializer, CounselSerializer
 from customers.models import Customer, CustomerSecurity
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 
-class CustomerSerializer(serializers.ModelSerializer):
+class CustomerSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     key = serializers.SerializerMethodField()
 
     class Meta:
@@ -22,21 +24,39 @@ class CustomerSerializer(serializers.ModelSerializer):
     def get_key(self, obj):
         """
         CustomerSecurity의 key를 반환.
+        목록 조회 시 select_related("security")로 미리 로드된 값을 사용한다.
         """
         if hasattr(obj, "security"):
             return obj.security.key
         return None
 
-    def create(self, validated_data):
-        """
-        고객과 CustomerSecurity 생성
-        """
-        customer = Customer.objects.create(**validated_data)
-        CustomerSecurity.objects.create(customer=customer)  # 기본값으로 생성
-        return customer
 
-
-class CustomerSecuritySerializer(serializers.ModelSerializer):
+class CustomerSecuritySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = CustomerSecurity
         fields = ["customer", "is_korean", "key"]
+
+
+class CustomerTimelineSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    고객 타임라인 항목 (상담 기록 또는 상담 문서)
+
+    MergedCreatedAtCursorPagination 이 반환하는 (종류, 객체) 를 직렬화한다.
+    type 에 해당하는 필드만 값이 있고 나머지는 null 이다.
+    """
+
+    type = serializers.ChoiceField(choices=["counsel", "document"])
+    created_at = serializers.DateTimeField()
+    counsel = CounselSerializer(allow_null=True)
+    document = CounselDocumentSerializer(allow_null=True)
+
+    def to_representation(self, item):
+        kind, instance = item
+        return super().to_representation(
+            {
+                "type": kind,
+                "created_at": instance.created_at,
+                "counsel": instance if kind == "counsel" else None,
+                "document": instance if kind == "document" else None,
+            }
+        )
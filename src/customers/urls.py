@@ -1,14 +1,19 @@
 from customers.views import (CustomerDetailView, CustomerListCreateView,
-                             CustomerSecurityEditView)
+                             CustomerSearchView, CustomerSecurityEditView,
+                             CustomerTimelineView)
 from django.urls import path
 
 app_name = "customers"
 urlpatterns = [
     path("", CustomerListCreateView.as_view(), name="customers"),
+    path("search/", CustomerSearchView.as_view(), name="customer-search"),
     path("<int:pk>/", CustomerDetailView.as_view(), name="customer-detail"),
     path(
         "<int:pk>/security/",
         CustomerSecurityEditView.as_view(),
         name="customer-security-edit",
     ),
+    path(
+        "<int:pk>/timeline/", CustomerTimelineView.as_view(), name="customer-timeline"
+    ),
 ]
@@ -1,17 +1,31 @@
-import logging
-
 from common.exceptions import (InternalServerException, NotFoundException,
                                UnauthorizedException)
+from common.hangul import (PHONE_SUFFIX_LENGTH, has_choseong,
+                           has_hangul_syllable, normalize_phone_number,
+                           to_choseong)
+from common.jobs import enqueue
+from common.logging_config import get_logger
+from common.pagination import (CreatedAtCursorPagination,
+                               MergedCreatedAtCursorPagination)
+from counsels.models import Counsel, CounselDocument
+from customers.jobs import purge_customer
 from customers.models import Customer, CustomerSecurity
 from customers.serializers import (CustomerSecuritySerializer,
-                                   CustomerSerializer)
-from drf_spectacular.utils import extend_schema
-from rest_framework.generics import (ListCreateAPIView, RetrieveUpdateAPIView,
+                                   CustomerSerializer,
+                                   CustomerTimelineSerializer)
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import (GenericAPIView, ListAPIView,
+                                     ListCreateAPIView, RetrieveUpdateAPIView,
                                      RetrieveUpdateDestroyAPIView)
 from rest_framework.permissions import IsAuthenticated
+from users.models import User
 
 # 공통 로거 가져오기
-logger = logging.getLogger("custom_api_logger")
+logger = get_logger()
 
 
 class CustomerListCreateView(ListCreateAPIView):
@@ -21,11 +35,13 @@ class CustomerListCreateView(ListCreateAPIView):
 
     serializer_class = CustomerSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
 
     @extend_schema(
         tags=["Customer"],
         summary="고객 목록 조회",
-        description="현재 로그인된 사용자의 모든 고객을 조회합니다.",
+        description="현재 로그인된 사용자의 고객을 최신순으로 조회합니다. "
+        "응답의 next/previous 커서로 다음 페이지를 조회합니다.",
         responses={
             200: CustomerSerializer(many=True),
             401: {
@@ -69,6 +85,104 @@ class CustomerListCreateView(ListCreateAPIView):
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)
 
+    def get_queryset(self):
+        user = self.request.user
+        logger.debug("고객 목록 조회 요청", user_id=user.id)
+        # security(1:1)를 같은 쿼리에서 JOIN 하여 고객별 추가 쿼리를 방지
+        return Customer.objects.filter(user_id=user.id).select_related("security")
+
+    def perform_create(self, serializer):
+        """
+        고객 생성 시, 로그인된 사용자와 연결
+
+        탈퇴한 사용자의 Access Token 도 만료 전까지는 인증되므로 탈퇴 여부를 확인한다.
+        사용자 행을 잠가 두어 탈퇴 처리가 이 고객을 놓치지 않도록 한다.
+        """
+        user_id = self.request.user.id
+        with transaction.atomic():
+            active = (
+                User.objects.select_for_update()
+                .filter(pk=user_id, deleted_at__isnull=True)
+                .values_list("pk", flat=True)
+                .first()
+            )
+            if active is None:
+                logger.warning("탈퇴한 사용자의 고객 생성 시도", user_id=user_id)
+                raise UnauthorizedException(
+                    detail="탈퇴한 사용자입니다.", request=self.request
+                )
+            customer = serializer.save(user_id=user_id)
+        logger.info("고객 생성 성공", user_id=user_id, customer_id=customer.id)
+
+
+class CustomerSearchView(ListAPIView):
+    """
+    고객 검색 API (이름, 초성, 전화번호)
+    """
+
+    serializer_class = CustomerSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+
+    @extend_schema(
+        tags=["Customer"],
+        summary="고객 검색",
+        description="현재 로그인된 사용자의 고객을 검색합니다. "
+        "이름 앞부분(김민), 초성(ㄱㅁㅅ), 전화번호 앞부분(0101234) 또는 뒤 4자리(5678)로 검색할 수 있습니다.",
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=str,
+                required=True,
+                description="검색어",
+            ),
+        ],
+        responses={
+            200: CustomerSerializer(many=True),
+            400: {
+                "type": "object",
+                "properties": {
+                    "q": {"type": "string", "example": "검색어를 입력하세요."},
+                },
+            },
+            401: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "Authentication credentials were not provided.",
+                    },
+                },
+            },
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        query = "".join(self.request.query_params.get("q", "").split())
+        if not query:
+            raise ValidationError({"q": "검색어를 입력하세요."})
+
+        queryset = Customer.objects.filter(user_id=self.request.user.id).select_related(
+            "security"
+        )
+        logger.debug("고객 검색 요청", user_id=self.request.user.id)
+
+        # 모든 조건은 (user, 파생 컬럼) 인덱스의 등호 / 접두어 검색으로 처리
+        digits = normalize_phone_number(query)
+        if digits and len(digits) == len(query.replace("-", "")):
+            condition = Q(phone_digits__startswith=digits)
+            if len(digits) == PHONE_SUFFIX_LENGTH:
+                condition |= Q(phone_suffix=digits)
+            return queryset.filter(condition)
+
+        queryset = queryset.filter(name_choseong__startswith=to_choseong(query))
+        if has_hangul_syllable(query) and not has_choseong(query):
+            # 완성된 음절로만 검색한 경우 초성 인덱스로 좁힌 뒤 이름 접두어를 확인
+            queryset = queryset.filter(name__startswith=query)
+        return queryset
+
 
 class CustomerDetailView(RetrieveUpdateDestroyAPIView):
     """
@@ -173,7 +287,10 @@ class CustomerDetailView(RetrieveUpdateDestroyAPIView):
     @extend_schema(
         tags=["Customer"],
         summary="특정 고객 삭제",
-        description="현재 로그인된 사용자가 소유한 특정 고객을 삭제합니다.",
+        description=(
+            "현재 로그인된 사용자가 소유한 특정 고객을 삭제합니다. "
+            "고객은 바로 조회되지 않으며, 상담 기록과 상담 문서는 백그라운드에서 삭제됩니다."
+        ),
         responses={
             204: {
                 "type": "object",
@@ -199,6 +316,80 @@ class CustomerDetailView(RetrieveUpdateDestroyAPIView):
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
 
+    def get_queryset(self):
+        return Customer.objects.filter(user_id=self.request.user.id).select_related(
+            "security"
+        )
+
+    def perform_destroy(self, instance):
+        """
+        연쇄 삭제를 요청 중에 실행하지 않도록 삭제 표시만 하고 삭제 작업을 큐에 넣는다
+        """
+        with transaction.atomic():
+            Customer.objects.filter(pk=instance.pk).update(deleted_at=timezone.now())
+            enqueue(purge_customer, customer_id=instance.pk)
+        logger.info(
+            "고객 삭제 요청", user_id=self.request.user.id, customer_id=instance.pk
+        )
+
+
+class CustomerTimelineView(GenericAPIView):
+    """
+    고객의 상담 기록과 상담 문서를 시간순으로 합친 타임라인 API
+    """
+
+    serializer_class = CustomerTimelineSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = MergedCreatedAtCursorPagination
+
+    @extend_schema(
+        tags=["Customer"],
+        summary="고객 타임라인 조회",
+        description="현재 로그인된 사용자가 소유한 고객의 상담 기록과 상담 문서를 "
+        "생성 시각 역순으로 합쳐 조회합니다. 고객 화면에서 상담 목록과 상담별 문서를 "
+        "따로 조회하지 않고 한 번에 가져올 수 있으며, 응답의 next/previous 커서로 "
+        "다음 페이지를 조회합니다.",
+        responses={
+            200: CustomerTimelineSerializer(many=True),
+            404: {
+                "type": "object",
+                "properties": {
+                    "detail": {"type": "string", "example": "Not found."},
+                },
+            },
+            401: {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "example": "Authentication credentials were not provided.",
+                    },
+                },
+            },
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        customer = self.get_object()
+        logger.debug(
+            "고객 타임라인 조회 요청", user_id=request.user.id, customer_id=customer.id
+        )
+        # 종류마다 한 페이지 분량만 조회 (고객 확인 포함 쿼리 3개)
+        page = self.paginate_queryset(
+            {
+                "counsel": Counsel.objects.filter(customer_id=customer.id).defer(
+                    "search_document"
+                ),
+                "document": CounselDocument.objects.filter(
+                    counsel__customer_id=customer.id
+                ).select_related("blob"),
+            }
+        )
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def get_queryset(self):
+        return Customer.objects.filter(user_id=self.request.user.id).only("id")
+
 
 @extend_schema(tags=["Customer"])
 class CustomerSecurityEditView(RetrieveUpdateAPIView):
@@ -208,10 +399,15 @@ class CustomerSecurityEditView(RetrieveUpdateAPIView):
 
     serializer_class = CustomerSecuritySerializer
     permission_classes = [IsAuthenticated]
+    # URL 의 pk 는 보안 정보가 아니라 고객의 id
+    lookup_field = "customer_id"
+    lookup_url_kwarg = "pk"
 
     def get_queryset(self):
-        customer_id = self.kwargs.get("pk")
-        return CustomerSecurity.objects.filter(customer__id=customer_id)
+        return CustomerSecurity.objects.filter(
+            customer__user_id=self.request.user.id,
+            customer__deleted_at__isnull=True,
+        )
 
     @extend_schema(
         tags=["Customer"],
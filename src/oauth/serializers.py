@@ -1,11 +1,12 @@
+from common.serializers import TimedSerializerMixin
 from django.contrib.auth.hashers import check_password
-from django.core.cache import cache
+from oauth.token_store import save_refresh_token
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 from users.models import User
 
 
-class LoginSerializer(serializers.Serializer):
+class LoginSerializer(TimedSerializerMixin, serializers.Serializer):
     phone_number = serializers.CharField(max_length=13)
     password = serializers.CharField(write_only=True)
 
@@ -31,10 +32,8 @@ class LoginSerializer(serializers.Serializer):
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
 
-        # Refresh Token 캐시에 저장
-        cache.set(
-            f"refresh_token:{user.id}", refresh_token, timeout=7 * 24 * 60 * 60
-        )  # 7일 만료
+        # Refresh Token 캐시에 저장 (만료 시간은 REFRESH_TOKEN_LIFETIME)
+        save_refresh_token(user.id, refresh_token)
 
         data["tokens"] = {
             "access": access_token,
@@ -0,0 +1,31 @@
+from django.core.cache import caches
+from rest_framework_simplejwt.settings import api_settings
+
+# 토큰 전용 캐시 (settings.CACHES["tokens"])
+TOKEN_CACHE_ALIAS = "tokens"
+REFRESH_TOKEN_NAMESPACE = "refresh_token"
+
+
+def refresh_token_timeout():
+    """
+    Refresh Token 캐시 만료 시간(초). SIMPLE_JWT 설정의 수명과 동일하게 맞춘다.
+    """
+    return int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+
+
+def refresh_token_key(user_id):
+    return f"{REFRESH_TOKEN_NAMESPACE}:{user_id}"
+
+
+def save_refresh_token(user_id, refresh_token):
+    caches[TOKEN_CACHE_ALIAS].set(
+        refresh_token_key(user_id), refresh_token, timeout=refresh_token_timeout()
+    )
+
+
+def get_refresh_token(user_id):
+    return caches[TOKEN_CACHE_ALIAS].get(refresh_token_key(user_id))
+
+
+def delete_refresh_token(user_id):
+    caches[TOKEN_CACHE_ALIAS].delete(refresh_token_key(user_id))
@@ -1,10 +1,10 @@
-import logging
-
 from common.exceptions import (BadRequestException, InternalServerException,
                                UnauthorizedException)
-from django.core.cache import cache
+from common.logging_config import get_logger
 from drf_spectacular.utils import extend_schema
 from oauth.serializers import LoginSerializer
+from oauth.token_store import (delete_refresh_token, get_refresh_token,
+                               refresh_token_timeout)
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
@@ -13,7 +13,7 @@ from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
 # 로거 설정
-logger = logging.getLogger("custom_api_logger")
+logger = get_logger()
 
 
 # 로그인
@@ -49,7 +49,7 @@ class LoginView(APIView):
         },
     )
     def post(self, request):
-        logger.debug(f"로그인 요청 데이터: {request.data}")
+        logger.debug("로그인 요청", data=request.data)
         serializer = LoginSerializer(data=request.data)
         if serializer.is_valid():
             tokens = serializer.validated_data["tokens"]
@@ -67,13 +67,11 @@ class LoginView(APIView):
                 httponly=True,
                 secure=True,
                 samesite="Lax",
-                max_age=7 * 24 * 60 * 60,  # 7일
-            )
-            logger.info(
-                f"로그인 성공: 사용자 {request.data.get('username', 'Unknown')}"
+                max_age=refresh_token_timeout(),
             )
+            logger.info("로그인 성공", user_id=serializer.validated_data["user"].id)
             return response
-        logger.error(f"로그인 실패: 유효성 검사 오류 {serializer.errors}")
+        logger.warning("로그인 실패: 유효성 검사 오류", errors=serializer.errors)
         raise BadRequestException(
             detail="전화번호 또는 비밀번호가 잘못되었습니다.", request=request
         )
@@ -135,12 +133,9 @@ class LogoutView(APIView):
                 )
 
             # Refresh Token 캐시에서 가져오기
-            refresh_token_key = f"refresh_token:{user_id}"
-            refresh_token = cache.get(refresh_token_key)
+            refresh_token = get_refresh_token(user_id)
             if not refresh_token:
-                logger.warning(
-                    f"로그아웃 실패: Refresh Token 누락 (사용자 ID: {user_id})"
-                )
+                logger.warning("로그아웃 실패: Refresh Token 누락", user_id=user_id)
                 raise BadRequestException(
                     detail="Refresh Token을 찾을 수 없습니다.", request=request
                 )
@@ -155,13 +150,13 @@ class LogoutView(APIView):
             refresh = RefreshToken(refresh_token)
             refresh.blacklist()
 
-            cache.delete(refresh_token_key)
+            delete_refresh_token(user_id)
 
             response = Response(
                 {"detail": "로그아웃에 성공했습니다."}, status=status.HTTP_200_OK
             )
             response.delete_cookie("refresh_token")
-            logger.info(f"로그아웃 성공: 사용자 ID {user_id}")
+            logger.info("로그아웃 성공", user_id=user_id)
             return response
 
         except Exception as e:
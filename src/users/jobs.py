@@ -0,0 +1,25 @@
+from common.jobs import job
+from common.logging_config import get_logger
+from customers.jobs import delete_customers
+from customers.models import Customer
+from django.conf import settings
+from users.models import User
+
+# 공통 로거 가져오기
+logger = get_logger()
+
+
+@job(max_attempts=5)
+def purge_user(user_id):
+    """
+    탈퇴한 사용자의 고객, 상담 기록, 상담 문서를 배치 단위로 삭제한 뒤 사용자 삭제
+    """
+    user = User.objects.filter(pk=user_id, deleted_at__isnull=False).first()
+    if user is None:
+        return
+
+    customers = delete_customers(
+        Customer.all_objects.filter(user_id=user_id), settings.PURGE_BATCH_SIZE
+    )
+    user.delete()
+    logger.info("회원 삭제 완료", user_id=user_id, customers=customers)
@@ -97,6 +97,8 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 탈퇴 요청 시각 (설정되면 비활성화되고, 고객과 상담 기록은 백그라운드에서 삭제됨)
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     # 인증에 사용할 필드를 설정. 전화번호로 로그인 가능
     USERNAME_FIELD = "phone_number"
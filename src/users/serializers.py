@@ -1,10 +1,11 @@
 import hashlib
 
+from common.serializers import TimedSerializerMixin
 from rest_framework import serializers
 from users.models import User
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     # 비밀번호 필드와 key 필드는 write-only로 설정
     password = serializers.CharField(write_only=True, min_length=8)
     key = serializers.CharField(write_only=True, min_length=6)
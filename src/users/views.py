@@ -1,23 +1,31 @@
-import logging
-
-from common.exceptions import BadRequestException, InternalServerException
+from common.exceptions import (BadRequestException, InternalServerException,
+                               NotFoundException)
+from common.jobs import enqueue
+from common.logging_config import get_logger
+from customers.models import Customer
+from django.db import transaction
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema
+from oauth.token_store import delete_refresh_token, get_refresh_token
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import (CreateAPIView, ListAPIView,
                                      RetrieveUpdateDestroyAPIView)
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+from users.jobs import purge_user
 from users.models import User
 from users.serializers import UserSerializer
 
 # 로거 가져오기
-logger = logging.getLogger("custom_api_logger")
+logger = get_logger()
 
 
 @extend_schema(tags=["User"])
 class UserListView(ListAPIView):
-    queryset = User.objects.all()
+    queryset = User.objects.filter(deleted_at__isnull=True)
     serializer_class = UserSerializer
     permission_classes = [
         IsAuthenticated,
@@ -63,7 +71,7 @@ class UserCreateView(CreateAPIView):
         회원가입 요청을 처리하는 메서드.
         """
         try:
-            logger.debug(f"회원가입 요청 데이터: {request.data}")
+            logger.debug("회원가입 요청", data=request.data)
 
             # 요청 데이터로 직렬화
             serializer = self.get_serializer(data=request.data)
@@ -71,7 +79,7 @@ class UserCreateView(CreateAPIView):
 
             # 사용자 생성
             user = serializer.save()
-            logger.info(f"회원가입 성공: {user.phone_number}")
+            logger.info("회원가입 성공", user_id=user.id)
 
             # 응답 데이터 준비
             response_data = {
@@ -92,7 +100,7 @@ class UserCreateView(CreateAPIView):
                 status=status.HTTP_201_CREATED,
             )
         except ValidationError as e:
-            logger.error(f"회원가입 요청 데이터 유효성 검사 실패: {e}")
+            logger.warning("회원가입 요청 데이터 유효성 검사 실패", errors=e.detail)
             raise BadRequestException(
                 detail="회원가입 요청 데이터가 유효하지 않습니다.", request=request
             )
@@ -203,7 +211,10 @@ class UserRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
     @extend_schema(
         tags=["User"],
         summary="로그인된 유저 계정 삭제",
-        description="현재 로그인된 사용자의 계정을 삭제합니다. 성공적으로 삭제되면 '회원탈퇴에 성공했습니다.' 메시지를 반환합니다.",
+        description=(
+            "현재 로그인된 사용자의 계정을 삭제합니다. 성공적으로 삭제되면 '회원탈퇴에 성공했습니다.' 메시지를 반환합니다. "
+            "계정은 바로 비활성화되며, 고객과 상담 기록은 백그라운드에서 삭제됩니다."
+        ),
         responses={
             204: {
                 "type": "object",
@@ -238,6 +249,34 @@ class UserRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
     def get_object(self):
         """
         로그인된 사용자 객체를 반환.
+        request.user 는 토큰 기반 사용자이므로 실제 User 를 조회한다.
+        """
+        logger.debug("사용자 정보 요청", user_id=self.request.user.id)
+        # 탈퇴 후 만료 전의 Access Token 으로 요청한 경우
+        user = User.objects.filter(
+            pk=self.request.user.id, deleted_at__isnull=True
+        ).first()
+        if user is None:
+            raise NotFoundException(detail="사용자를 찾을 수 없습니다.")
+        return user
+
+    def perform_destroy(self, instance):
         """
-        logger.debug(f"사용자 정보 요청: User ID {self.request.user.id}")
-        return self.request.user
+        연쇄 삭제를 요청 중에 실행하지 않도록 계정을 비활성화하고 고객을 삭제 표시한 뒤
+        삭제 작업을 큐에 넣는다
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            User.objects.filter(pk=instance.pk).update(is_active=False, deleted_at=now)
+            Customer.objects.filter(user_id=instance.pk).update(deleted_at=now)
+            enqueue(purge_user, user_id=instance.pk)
+
+        # 다시 로그인하거나 토큰을 재발급받지 못하도록 Refresh Token 폐기
+        refresh_token = get_refresh_token(instance.pk)
+        if refresh_token:
+            try:
+                RefreshToken(refresh_token).blacklist()
+            except TokenError:
+                pass
+            delete_refresh_token(instance.pk)
+        logger.info("회원탈퇴 요청", user_id=instance.pk)